@@ -1,7 +1,15 @@
 from .aioruneclient import AioRuneClient
+from .cache import RuneCache
 from .errors import *
+from .export import RuneTable
+from .index import RuneIndex
+from .ratelimit import RateLimiter
+from .refresh import ChampDiff, RefreshStats
+from .retry import CircuitBreaker, RetryPolicy
 from .runeclient import RuneClient
 from .runepage import *
+from .snapshot import Snapshot, load_snapshot, save_snapshot
+from .stats import ClientStats
 
 __title__ = 'lolrune'
 __author__ = 'James E'
@@ -10,8 +18,24 @@ __version__ = '0.0.0'
 
 __all__ = ('RuneClient',
            'AioRuneClient',
+           'RuneCache',
+           'RuneIndex',
+           'RuneTable',
+           'RefreshStats',
+           'ChampDiff',
+           'ClientStats',
+           'RetryPolicy',
+           'CircuitBreaker',
+           'RateLimiter',
            'LoLRuneException',
            'RuneConnectionError',
            'ChampNotFoundError',
+           'CircuitOpenError',
+           'RuneParseError',
+           'SnapshotError',
            'RunePage',
-           'Champion')
+           'Champion',
+           'BulkResult',
+           'Snapshot',
+           'load_snapshot',
+           'save_snapshot')
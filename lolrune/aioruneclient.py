@@ -1,25 +1,96 @@
 import asyncio
-from typing import Tuple
+import time
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Tuple
 
 import aiohttp
 
-from . import utils
+from . import snapshot, utils
+from .cache import RuneCache
+from .core import RuneEngine
 from .errors import *
-from .runepage import Champion
+from .ratelimit import RateLimiter
+from .refresh import ChampDiff, next_delay
+from .retry import CircuitBreaker, RetryPolicy
+from .runepage import BulkResult, Champion
+from .stats import ClientStats
 
 
-class AioRuneClient:
+class AioRuneClient(RuneEngine):
     """An asynchronous version of :class:`RuneClient` used to fetch optimal runes for champions.
     You can find a brief example :ref:`here <aio_client_ex>`.
 
+    Constructing the client performs no I/O, so it is safe to do inside a running event loop.
+    ``rune_links`` is loaded lazily on first use, or eagerly through :meth:`create`.
+    The client can also be used as an async context manager, which closes the session it owns on exit.
+
     Parameters
     ----------
     session : :class:`aiohttp.ClientSession`, optional
         The aiohttp session used in all requests. If none is provided,
-        a new session will be created.
+        a new session will be created on the first request and closed by :meth:`close`.
+        Its connector is configured by ``pool_size``, ``pool_per_host`` and ``keep_alive``.
 
     loop : :class:`asyncio.AbstractEventLoop`, optional
-        The asyncio event loop. If none is provided, a new loop will be created.
+        Unused, the running event loop is always used. Kept for backwards compatibility.
+
+    max_concurrency : int, optional
+        The maximum number of requests in flight at once. Parsing is not bounded by it: pages are parsed
+        one at a time on the event loop, or as ``executor`` allows. Defaults to 8.
+
+    cache : :class:`RuneCache`, optional
+        A cache for parsed loadout pages, keyed by URL. Expired pages are revalidated with conditional requests.
+        If none is provided, every page is fetched and parsed on each call.
+
+    parser : str, optional
+        The html parser backend, either ``'bs4'`` or the faster ``'lxml'``. Both produce identical output.
+        Defaults to ``'bs4'``.
+
+    pool_size : int, optional
+        The total number of connections open at once in a session the client creates. Defaults to 32.
+
+    pool_per_host : int, optional
+        The number of connections open at once per host in a session the client creates. Defaults to 16.
+
+    timeout : Tuple[float, float], optional
+        The connect and read timeouts in seconds, applied to every request. Defaults to ``(5.0, 15.0)``.
+
+    keep_alive : bool, optional
+        Whether connections are kept open and reused between requests. Defaults to ``True``.
+
+    keepalive_timeout : float, optional
+        How many seconds an idle connection is kept open for. Defaults to 15.
+
+    retry : :class:`RetryPolicy`, optional
+        How transient failures, such as timeouts and 5xx or 429 responses, are retried.
+        Defaults to ``RetryPolicy()``, pass ``RetryPolicy(retries=0)`` to disable retrying.
+
+    circuit_breaker : :class:`CircuitBreaker`, optional
+        Stops requests for a while after repeated failures. It can be shared between clients.
+        Defaults to ``CircuitBreaker()``.
+
+    serve_stale : bool, optional
+        Whether a loadout page which cannot be fetched is served from its last known version in ``cache``,
+        even if it expired. The error is raised if there is no such version. Defaults to ``False``.
+
+    executor : :class:`concurrent.futures.Executor`, optional
+        An executor to parse pages in, keeping the event loop responsive while the homepage is parsed.
+        A :class:`~concurrent.futures.ProcessPoolExecutor` also spreads bulk fetches across cores.
+        The client does not shut it down. If none is provided, pages are parsed on the event loop.
+
+    stats : :class:`ClientStats`, optional
+        Collects request counts and per-stage timings. It can be shared between clients.
+        If none is provided, nothing is measured.
+
+    url : str, optional
+        The base URL to request instead of ``URL``, e.g. that of a :class:`~lolrune.server.FixtureServer`.
+        Loadout URLs are taken from the homepage, so they follow it.
+
+    rate_limiter : :class:`RateLimiter`, optional
+        Limits how fast requests are made, retries included. It can be shared between clients,
+        sync and async alike, to keep them all under one budget. If none is provided, requests are not limited.
 
     Attributes
     ----------
@@ -31,6 +102,10 @@ class AioRuneClient:
 
     rune_links : dict
         A dict containing all champ's individual rune pages.
+        This is empty until the champions are first loaded.
+
+    refresh_stats : :class:`RefreshStats`
+        Timing metrics for background refreshes of ``rune_links``, see :meth:`start_auto_refresh`.
 
     Note
     ----
@@ -46,51 +121,409 @@ class AioRuneClient:
           ], ...
         }
     """
-    HEADERS = {'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:57.0) Gecko/20100101 Firefox/57.0'}
-    URL = 'http://runeforge.gg'
 
-    def __init__(self, session: aiohttp.ClientSession = None, loop: asyncio.AbstractEventLoop = None):
-        self.loop = loop or asyncio.get_event_loop()
-        self.session = session or aiohttp.ClientSession(loop=self.loop)
-        # TODO:
-        # Make this not awful by removing run_until_complete
-        self.rune_links = utils.parse_rune_links(self.loop.run_until_complete(self._get(self.URL)))
+    def __init__(self, session: aiohttp.ClientSession = None, loop: asyncio.AbstractEventLoop = None,
+                 max_concurrency: int = 8, cache: RuneCache = None, parser: str = 'bs4', pool_size: int = 32,
+                 pool_per_host: int = 16, timeout: Tuple[float, float] = (5.0, 15.0), keep_alive: bool = True,
+                 keepalive_timeout: float = 15.0, retry: RetryPolicy = None, circuit_breaker: CircuitBreaker = None,
+                 serve_stale: bool = False, executor: Executor = None,
+                 stats: ClientStats = None, url: str = None,
+                 rate_limiter: RateLimiter = None):
+        super().__init__(cache=cache, parser=parser, retry=retry, circuit_breaker=circuit_breaker,
+                         serve_stale=serve_stale, stats=stats, url=url, rate_limiter=rate_limiter)
+        self.loop = loop
+        self.session = session
+        self._owns_session = session is None
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(connect=timeout[0], sock_read=timeout[1])
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self._champs_loaded = False
+        # asyncio primitives are created lazily so they bind to the loop the client is used on
+        self._semaphore = None
+        self._champs_lock = None
+        self._refresh_task = None
+        self._auto_refresh_task = None
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> 'AioRuneClient':
+        """An awaitable constructor which also loads ``rune_links`` before returning.
+        Takes the same arguments as :class:`AioRuneClient`.
+
+        Returns
+        -------
+        :class:`AioRuneClient`
+            A client with its champions already loaded.
+
+        Raises
+        ------
+        RuneConnectionError
+            If the GET response status is not 200.
+        """
+        client = cls(*args, **kwargs)
+        await client.update_champs()
+        return client
+
+    @classmethod
+    async def from_snapshot(cls, path: str, max_age: float = None, **kwargs) -> 'AioRuneClient':
+        """Creates a client from a snapshot file without any network I/O.
+        The snapshot's pages are loaded into the client's cache, creating a :class:`RuneCache` if none is passed.
+
+        Parameters
+        ----------
+        path : str
+            The snapshot file written by :meth:`save_snapshot`.
+
+        max_age : float, optional
+            The age in seconds after which the snapshot is considered stale.
+            A stale snapshot is still used, but its pages are fetched again before they are served,
+            and ``rune_links`` is refreshed in a background task.
+            If none is passed, the snapshot is never refreshed.
+
+        \\*\\*kwargs
+            Passed on to :class:`AioRuneClient`.
+
+        Returns
+        -------
+        :class:`AioRuneClient`
+            A client serving the snapshot's data.
+
+        Raises
+        ------
+        SnapshotError
+            If the snapshot cannot be loaded.
+        """
+        # Reading the file is blocking, so keep it off the event loop
+        snap = await asyncio.get_event_loop().run_in_executor(None, snapshot.load_snapshot, path)
+
+        stale = cls._snapshot_is_stale(snap, max_age)
+        cache = cls._load_snapshot_cache(snap, kwargs.pop('cache', None), stale)
+
+        client = cls(cache=cache, **kwargs)
+        client.rune_links = snap.rune_links
+        client._champs_loaded = True
+        if stale:
+            client._refresh_task = asyncio.ensure_future(client._refresh_in_background())
+
+        return client
+
+    async def _refresh_in_background(self):
+        """Runs :meth:`update_champs`, recording it in ``refresh_stats`` and logging failures.
+        Any error is caught, so a homepage the parser chokes on does not end the refresher.
+        """
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            await self.update_champs()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._record_refresh(started, start, e)
+        else:
+            self._record_refresh(started, start)
+
+    async def _auto_refresh(self, interval: float, jitter: float):
+        while True:
+            await asyncio.sleep(next_delay(interval, jitter))
+            await self._refresh_in_background()
+
+    def start_auto_refresh(self, interval: float = 3600.0, jitter: float = 0.1):
+        """Starts refreshing ``rune_links`` periodically in a background task on the running loop.
+
+        The new index is only swapped in once it has been fully built, so lookups never see a partial index.
+        A failed refresh leaves the current index in place. See ``self.refresh_stats`` for timings.
+        Calling this while a refresher is running has no effect.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The average number of seconds between refreshes. Defaults to one hour.
+
+        jitter : float, optional
+            The largest fraction of ``interval`` added or removed at random for each wait. Defaults to ``0.1``.
+        """
+        if self._auto_refresh_task is not None and not self._auto_refresh_task.done():
+            return
+
+        self._auto_refresh_task = asyncio.ensure_future(self._auto_refresh(interval, jitter))
+
+    async def stop_auto_refresh(self):
+        """Stops the refresher started by :meth:`start_auto_refresh`."""
+        if self._auto_refresh_task is None:
+            return
+
+        self._auto_refresh_task.cancel()
+        try:
+            await self._auto_refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._auto_refresh_task = None
+
+    async def __aenter__(self) -> 'AioRuneClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Stops the background refreshes and closes the :class:`aiohttp.ClientSession`, if the client created it.
+        Sessions passed in by the user are left open.
+        """
+        await self.stop_auto_refresh()
+        if self._refresh_task is not None:
+            # A refresh of a stale snapshot, see from_snapshot
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the session, creating one on first use."""
+        if self.session is None:
+            if self.keep_alive:
+                connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_per_host,
+                                                 keepalive_timeout=self.keepalive_timeout)
+            else:
+                connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_per_host,
+                                                 force_close=True)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self.session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore bounding concurrent requests, creating one on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _ensure_champs(self):
+        """Loads ``rune_links`` if it has not been loaded yet.
+        Concurrent callers share a single homepage request.
+        """
+        if self._champs_loaded:
+            return
+
+        if self._champs_lock is None:
+            self._champs_lock = asyncio.Lock()
+
+        async with self._champs_lock:
+            if not self._champs_loaded:
+                await self.update_champs()
+
+    async def _get_once(self, url: str, headers: dict = None) -> utils.Response:
+        """Makes a single GET request, see :meth:`_get`."""
+        async with self._get_semaphore():
+            # Taken once a slot is free, so requests queued on the semaphore cannot burst past the limiter
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            async with self._get_session().get(url, headers=self._request_headers(headers), timeout=self.timeout) as r:
+                if r.status != 200:
+                    return self._response(r.status, r.headers, None, 0, bool(headers))
+                text = await r.text()
+                # The body is kept by the response once read, so this returns it without a copy
+                body = await r.read()
+                return self._response(r.status, r.headers, text, len(body), bool(headers))
 
-    async def _get(self, url: str) -> str:
-        """A small wrapper method which makes a quick GET request
+    async def _get(self, url: str, headers: dict = None) -> utils.Response:
+        """A small wrapper method which makes a quick GET request.
+        At most ``max_concurrency`` requests are made at once, no faster than ``self.rate_limiter`` allows.
+        Transient failures are retried according to ``self.retry``, without holding a concurrency slot while waiting.
 
         Parameters
         ----------
         url : str
             The URL to get.
 
+        headers : dict, optional
+            Extra headers sent along with ``HEADERS``.
+
         Returns
         -------
-        str
-            The raw html of the requested page.
+        :obj:`utils.Response`
+            The status, headers and raw html of the requested page.
 
         Raises
         ------
         RuneConnectionError
-            If the GET response status is not 200.
+            If the GET response status is not 200, or 304 for a conditional request,
+            or if no response was received, e.g. because of a timeout, once retries ran out.
+
+        CircuitOpenError
+            If ``self.circuit_breaker`` is open.
         """
-        async with self.session.get(url, headers=self.HEADERS) as r:
-            if r.status == 200:
-                return await r.text()
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request()
+            start = time.perf_counter() if self.stats is not None else None
+            try:
+                resp = await self._get_once(url, headers)
+            except (RuneConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = self._attempt_failed(url, attempt, e, start)
+                if delay is None:
+                    if isinstance(e, RuneConnectionError):
+                        raise
+                    raise RuneConnectionError(None, reason=repr(e)) from e
+                await asyncio.sleep(delay)
+                attempt += 1
             else:
-                raise RuneConnectionError(r.status)
+                self._attempt_succeeded(resp, start)
+                return resp
+
+    async def _get_parsed(self, url: str, parser: Callable[[str], Any], previous: Any = None) -> Any:
+        """Makes a GET request and parses the response.
+        If ``previous`` is passed, the request is conditional, and ``previous`` is returned
+        without parsing if the page has not changed since it was last parsed.
+
+        Parameters
+        ----------
+        url : str
+            The URL to get.
+
+        parser : Callable[[str], Any]
+            Parses the raw html of the page. It is run in ``self.executor``, if there is one,
+            so it must be picklable for a process pool.
+
+        previous : Any, optional
+            The result of parsing the page last time, if it is still at hand.
 
-    async def update_champs(self):
+        Returns
+        -------
+        Any
+            The parsed page.
+
+        Raises
+        ------
+        RuneConnectionError
+            If the GET response status is not 200 or 304.
+
+        RuneParseError
+            If the parser fails on the page.
+        """
+        resp = await self._get(url, self._conditional_headers(url, previous))
+        if self.executor is None or resp.status == 304:
+            return self._parse_response(url, resp, parser, previous)
+
+        with self._parsing(url):
+            result = await asyncio.get_event_loop().run_in_executor(self.executor, parser, resp.text)
+        return self._remember(url, resp, result)
+
+    async def resolve_champion(self, champion_name: str) -> str:
+        """A method which resolves a loosely typed champion name to its key in ``self.rune_links``.
+        Case, spaces and punctuation are ignored, and common nicknames, unique prefixes and
+        small typos are accepted, e.g. ``"Kai'Sa"``, ``'wukong'`` and ``'velkz'``.
+
+        Parameters
+        ----------
+        champion_name : str
+            The champion name to resolve.
+
+        Returns
+        -------
+        str
+            The champion's key in ``self.rune_links``.
+
+        Raises
+        ------
+        ChampNotFoundError
+            If the name matches no champion, or more than one.
+        """
+        await self._ensure_champs()
+        return self._resolve(champion_name)
+
+    async def update_champs(self, prefetch: bool = False) -> ChampDiff:
         """A method which updates ``self.rune_links``.
         This is useful because runeforge.gg is frequently updating.
+        The homepage is only parsed again if it has changed since the last update.
+
+        Cached pages of loadouts which are still listed are kept, and those of loadouts which are gone are dropped,
+        so only new loadouts need fetching afterwards.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            Whether to fetch and cache the new loadouts straight away. Failures are logged, not raised.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        :obj:`ChampDiff`
+            The champions and loadout URLs which were added, removed or changed.
 
         Raises
         ------
         RuneConnectionError
-            If the request does not return with a status of 200.
+            If the request does not return with a status of 200 or 304.
+
+        RuneParseError
+            If the homepage cannot be parsed.
+
+        LoLRuneException
+            If no champions could be parsed from the homepage. ``self.rune_links`` is left untouched.
+        """
+        diff = self._apply_links(await self._get_parsed(self.URL, self._parser.links, self.rune_links or None))
+        self._champs_loaded = True
+
+        if prefetch and diff.new_urls:
+            urls = list(diff.new_urls)
+            results = await asyncio.gather(*(self._fetch_rune_page(x) for x in urls), return_exceptions=True)
+            self._log_prefetch(urls, results)
+
+        return diff
+
+    async def _load_rune_page(self, url: str) -> dict:
+        """Fetches, parses and caches a single loadout page, falling back to a stale copy if allowed."""
+        try:
+            rune_page = await self._get_parsed(url, self._page_parser(url), self._previous_page(url))
+        except RuneConnectionError as e:
+            return self._stale_page(url, e)
+
+        return self._store_page(url, rune_page)
+
+    def _finish_inflight(self, url: str, task: asyncio.Future):
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Every caller may have been cancelled, so mark a failure as retrieved to keep asyncio from logging it
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_rune_page(self, url: str) -> dict:
+        """Fetches and parses a single loadout page.
+        Pages found in ``self.cache`` are returned without a request.
+        If the request fails and ``self.serve_stale`` is set, the last known version of the page is returned.
+
+        Coroutines asking for a page which is already being fetched await that fetch and share its result,
+        so a burst of lookups for one champion makes a single request per loadout.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the loadout page.
+
+        Returns
+        -------
+        dict
+            The parsed rune information for the loadout.
         """
-        html = await self._get(self.URL)
-        self.rune_links = utils.parse_rune_links(html)
+        rune_page = self._cached_page(url)
+        if rune_page is not None:
+            return rune_page
+
+        task = self._inflight.get(url)
+        if self.stats is not None:
+            self.stats.record_lookup(coalesced=task is not None)
+        if task is None:
+            task = self._inflight[url] = asyncio.ensure_future(self._load_rune_page(url))
+            task.add_done_callback(partial(self._finish_inflight, url))
+
+        # Shielded, so a cancelled caller does not cancel the fetch for everyone else
+        return await asyncio.shield(task)
 
     async def get_raw(self, champion_name: str) -> Tuple[dict]:
         """A method to retrieve **raw** optimal runes for a given champion.
@@ -98,7 +531,7 @@ class AioRuneClient:
         Parameters
         ----------
         champion_name : str
-            Case insensitive name of the champion to get runes for.
+            Name of the champion to get runes for, resolved with :meth:`resolve_champion`.
 
         Returns
         -------
@@ -109,19 +542,20 @@ class AioRuneClient:
         ----
         Please see :ref:`raw_return_formatting` for more information on the return type.
 
+        Warning
+        -------
+        The dicts are shared with ``self.cache`` and with the :class:`Champion`\\s built from them, whose
+        equality and hash are read from the dicts. Copy them, e.g. with :func:`copy.deepcopy`, before mutating them.
+
         Raises
         ------
         ChampNotFoundError
-            If the champion is not found in ``self.rune_links``.
+            If the champion cannot be resolved to one in ``self.rune_links``.
         """
-        champion_lower = champion_name.lower()
-        if champion_lower not in self.rune_links:
-            raise ChampNotFoundError(champion_name)
+        await self._ensure_champs()
 
-        rune_list = []
-        for x in self.rune_links[champion_lower]:
-            html = await self._get(x)
-            rune_list.append(utils.parse_rune_html(html, x))
+        # gather keeps the results in the same order as rune_links
+        rune_list = await asyncio.gather(*(self._fetch_rune_page(x) for x in self._champion_urls(champion_name)))
 
         return tuple(rune_list)
 
@@ -131,7 +565,7 @@ class AioRuneClient:
         Parameters
         ----------
         champion_name : str
-            Case insensitive name of the champion to get runes for.
+            Name of the champion to get runes for, resolved with :meth:`resolve_champion`.
         
         Returns
         -------
@@ -145,10 +579,91 @@ class AioRuneClient:
         Raises
         ------
         ChampNotFoundError
-            If the champion is not found in ``self.rune_links``.
+            If the champion cannot be resolved to one in ``self.rune_links``.
+        """
+        return self._build_all(await self.get_raw(champion_name))
+
+    async def iter_runes(self, *champion_names: str) -> AsyncIterator[Champion]:
+        """An async generator which yields the runepage objects of one or more champions as soon as each is parsed,
+        rather than once all of them are.
+
+        At most ``max_concurrency`` loadout pages are fetched at once, and the next is only requested
+        when one finishes, so memory stays bounded however many champions are requested.
+        Closing the generator early stops requesting pages.
+
+        Parameters
+        ----------
+        \\*champion_names : str
+            Names of the champions to get runes for, resolved with :meth:`resolve_champion`.
+
+        Yields
+        ------
+        :class:`Champion`
+            Each loadout, in the order the pages finish. Use :attr:`Champion.name` to tell champions apart.
+
+        Raises
+        ------
+        ChampNotFoundError
+            If a champion cannot be resolved, before any page is fetched.
+
+        RuneConnectionError
+            If a page cannot be fetched. Pages still in flight are abandoned.
+        """
+        await self._ensure_champs()
+        urls = iter(self._resolve_urls(champion_names))
+
+        pending = {asyncio.ensure_future(self._fetch_rune_page(x)) for x in islice(urls, self.max_concurrency)}
+        done = set()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    rune_page = task.result()
+                    # Keep the window full while the caller handles this page
+                    for url in islice(urls, 1):
+                        pending.add(asyncio.ensure_future(self._fetch_rune_page(url)))
+                    yield self._build(rune_page)
+        finally:
+            for task in pending:
+                task.cancel()
+            # Pages which failed alongside the one raised are not read otherwise, and asyncio would log them
+            for task in done:
+                if not task.cancelled():
+                    task.exception()
+
+    async def _get_runes_or_error(self, champion_name: str):
+        """Wraps :meth:`get_runes`, returning recoverable errors instead of raising them."""
+        try:
+            return await self.get_runes(champion_name)
+        except LoLRuneException as e:
+            return e
+
+    async def get_runes_many(self, champion_names: Iterable[str]) -> BulkResult:
+        """A method to retrieve the runepage objects of many champions at once.
+        The champions are fetched concurrently, with at most ``max_concurrency`` requests in flight.
+
+        Parameters
+        ----------
+        champion_names : Iterable[str]
+            Case insensitive names of the champions to get runes for.
+
+        Returns
+        -------
+        :obj:`BulkResult`
+            The fetched :class:`Champion`\\s, along with any errors raised for individual champions.
+            A failing champion does not abort the rest of the batch.
         """
-        champion_lower = champion_name.lower()
-        if champion_lower not in self.rune_links:
-            raise ChampNotFoundError(champion_name)
+        names = self._distinct(champion_names)
+        results = await asyncio.gather(*(self._get_runes_or_error(x) for x in names))
+        return self._bulk_result(names, results)
+
+    async def get_all_runes(self) -> BulkResult:
+        """A method to retrieve the runepage objects of every champion in ``self.rune_links``.
 
-        return tuple(Champion(x) for x in await self.get_raw(champion_lower))
+        Returns
+        -------
+        :obj:`BulkResult`
+            See :meth:`get_runes_many`.
+        """
+        await self._ensure_champs()
+        return await self.get_runes_many(self.rune_links)
@@ -0,0 +1,197 @@
+"""Offline benchmarks for the html parsers and the client request paths.
+
+Run ``python -m lolrune.bench`` to benchmark against the bundled fixtures and print the results as JSON.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence
+
+from . import __version__, utils
+from .aioruneclient import AioRuneClient
+from .replay import FIXTURES_DIR, AioReplaySession, ReplaySession, load_fixtures
+from .runeclient import RuneClient
+
+
+def _percentile(samples: Sequence[float], q: float) -> float:
+    """Returns the ``q`` percentile of already sorted ``samples`` using the nearest-rank method."""
+    rank = max(int(round(q / 100 * len(samples))) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+def measure(name: str, calls: Sequence[Callable[[], Any]], pages: int, rounds: int = 20, warmup: int = 1) -> dict:
+    """A function which times a round of calls several times over.
+
+    Every call is timed individually. Allocations are traced in a separate round,
+    since tracing them slows the calls down.
+
+    Parameters
+    ----------
+    name : str
+        The name the results are reported under.
+
+    calls : Sequence[Callable[[], Any]]
+        The calls making up a round.
+
+    pages : int
+        The number of pages fetched or parsed in a round.
+
+    rounds : int, optional
+        The number of timed rounds. Defaults to 20.
+
+    warmup : int, optional
+        The number of untimed rounds run first. Defaults to 1.
+
+    Returns
+    -------
+    dict
+        Throughput, per-call latency percentiles in milliseconds and the peak traced allocation in KiB.
+    """
+    for _ in range(warmup):
+        for call in calls:
+            call()
+
+    samples = []
+    for _ in range(rounds):
+        for call in calls:
+            start = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        for call in calls:
+            call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    total = sum(samples)
+    samples.sort()
+    return {'name': name,
+            'calls': len(samples),
+            'pages': pages * rounds,
+            'total_s': total,
+            'pages_per_s': pages * rounds / total if total else 0.0,
+            'p50_ms': _percentile(samples, 50) * 1000,
+            'p90_ms': _percentile(samples, 90) * 1000,
+            'p99_ms': _percentile(samples, 99) * 1000,
+            'max_ms': samples[-1] * 1000,
+            'peak_alloc_kib': peak / 1024}
+
+
+def bench_parsers(pages: Dict[str, str], rounds: int = 20) -> List[dict]:
+    """A function which benchmarks every parser backend on the homepage and on each loadout page.
+
+    Parameters
+    ----------
+    pages : Dict[str, str]
+        The raw html of the homepage and loadout pages, keyed by URL, see :func:`load_fixtures`.
+
+    rounds : int, optional
+        The number of timed rounds. Defaults to 20.
+
+    Returns
+    -------
+    List[dict]
+        The results of :func:`measure` for each backend and page type.
+    """
+    homepage = pages[next(url for url in pages if '/loadouts/' not in url)]
+    loadouts = [(url, html) for url, html in pages.items() if '/loadouts/' in url]
+
+    results = []
+    for backend, parser in sorted(utils.PARSERS.items()):
+        results.append(measure('parse.links.{}'.format(backend), [partial(parser.links, homepage)], 1, rounds))
+        results.append(measure('parse.page.{}'.format(backend),
+                               [partial(parser.page, html, url) for url, html in loadouts], len(loadouts), rounds))
+
+    return results
+
+
+def _run_sync(loop: asyncio.AbstractEventLoop, func: Callable, *args) -> Any:
+    return loop.run_until_complete(func(*args))
+
+
+def bench_clients(pages: Dict[str, str], rounds: int = 20) -> List[dict]:
+    """A function which benchmarks ``get_raw`` of both clients for every champion, served from ``pages``.
+
+    Parameters
+    ----------
+    pages : Dict[str, str]
+        The raw html of the homepage and loadout pages, keyed by URL, see :func:`load_fixtures`.
+
+    rounds : int, optional
+        The number of timed rounds. Defaults to 20.
+
+    Returns
+    -------
+    List[dict]
+        The results of :func:`measure` for each client and parser backend.
+    """
+    results = []
+    loop = asyncio.new_event_loop()
+    try:
+        for backend in sorted(utils.PARSERS):
+            client = RuneClient(session=ReplaySession(pages), parser=backend)
+            page_count = sum(len(links) for links in client.rune_links.values())
+            results.append(measure('client.sync.{}'.format(backend),
+                                   [partial(client.get_raw, champ) for champ in client.rune_links], page_count, rounds))
+
+            aio_client = loop.run_until_complete(AioRuneClient.create(session=AioReplaySession(pages), parser=backend))
+            calls = [partial(_run_sync, loop, aio_client.get_raw, champ) for champ in aio_client.rune_links]
+            results.append(measure('client.async.{}'.format(backend), calls, page_count, rounds))
+    finally:
+        loop.close()
+
+    return results
+
+
+def run_benchmarks(directory: str = FIXTURES_DIR, rounds: int = 20) -> dict:
+    """A function which runs every benchmark against a fixture directory.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The fixture directory, see :func:`load_fixtures`. Defaults to the bundled fixtures.
+
+    rounds : int, optional
+        The number of timed rounds. Defaults to 20.
+
+    Returns
+    -------
+    dict
+        The environment the benchmarks ran in, and a list of results.
+    """
+    pages = load_fixtures(directory)
+    return {'meta': {'lolrune': __version__,
+                     'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'timestamp': time.time(),
+                     'fixtures': directory,
+                     'rounds': rounds},
+            'results': bench_parsers(pages, rounds) + bench_clients(pages, rounds)}
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m lolrune.bench', description=__doc__.splitlines()[0])
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='fixture directory containing an index.json')
+    parser.add_argument('--rounds', type=int, default=20, help='number of timed rounds')
+    parser.add_argument('--output', default='-', help='file to write the JSON results to, - for stdout')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.fixtures, args.rounds)
+    if args.output == '-':
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
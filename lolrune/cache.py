@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class RuneCache:
+    """A thread-safe, in-memory cache with TTL expiry and LRU eviction.
+    Both :class:`RuneClient` and :class:`AioRuneClient` accept one to store parsed loadout pages, keyed by their URL.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries kept. When full, the least recently used entry is evicted.
+        Defaults to 512, which comfortably fits every loadout on runeforge.gg.
+
+    ttl : float, optional
+        The number of seconds an entry stays fresh for. ``None`` disables expiry. Defaults to one hour.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups which found a fresh entry.
+
+    misses : int
+        The number of lookups which found nothing, or only an expired entry.
+
+    Note
+    ----
+    Any object with the same ``get``, ``set``, ``pop``, ``clear`` and ``items`` methods
+    can be passed to the clients instead. An optional ``get_stale`` method lets the clients
+    fall back to expired entries while runeforge.gg is down.
+    Expired entries are kept until they are evicted or overwritten, for :meth:`get_stale`.
+    Cached values are shared, not copied, so they should not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time or None, value), ordered from least to most recently used
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<RuneCache size={1} maxsize={0.maxsize} ttl={0.ttl} hits={0.hits} misses={0.misses}>'.format(
+            self, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry)
+
+    @staticmethod
+    def _expired(entry: tuple) -> bool:
+        return entry[0] is not None and entry[0] <= time.monotonic()
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The fraction of lookups which were hits, or ``0.0`` if there were none."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the fresh value stored under ``key``, or ``default``.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look up, e.g. a loadout URL.
+
+        default : Any, optional
+            Returned when there is no fresh entry. Defaults to ``None``.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            if self._expired(entry):
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value stored under ``key`` even if it has expired, or ``default``.
+        Does not count as a hit or a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look up, e.g. a loadout URL.
+
+        default : Any, optional
+            Returned when there is no entry. Defaults to ``None``.
+        """
+        entry = self._data.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, age: float = 0.0):
+        """Stores ``value`` under ``key``, evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to store under, e.g. a loadout URL.
+
+        value : Any
+            The value to store.
+
+        age : float, optional
+            How many seconds old ``value`` already is, e.g. when loaded from a snapshot.
+            It expires ``ttl - age`` seconds from now, so a value older than ``ttl`` is stored already expired,
+            only available to :meth:`get_stale`. Defaults to 0.
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl - age
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self) -> list:
+        """Returns a list of ``(key, value)`` pairs for every fresh entry."""
+        with self._lock:
+            return [(k, v) for k, (expires, v) in self._data.items() if not self._expired((expires, v))]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes ``key`` from the cache, returning its value or ``default``."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Removes every entry and resets the hit and miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
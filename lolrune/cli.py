@@ -0,0 +1,159 @@
+"""Fetch champions' runes from runeforge.gg, dump the whole roster or benchmark the client.
+
+Run ``lolrune --help``, or ``python -m lolrune --help``, for usage.
+Every subcommand runs against runeforge.gg by default, or offline against saved pages with ``--fixtures``.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, Sequence
+
+from . import __version__, export
+from .bench import run_benchmarks
+from .cache import RuneCache
+from .errors import LoLRuneException
+from .replay import FIXTURES_DIR, ReplaySession, load_fixtures
+from .runeclient import RuneClient
+from .stats import ClientStats
+
+
+@contextmanager
+def _open_output(path: str, newline: str = None) -> Iterator[IO[str]]:
+    if path == '-':
+        yield sys.stdout
+    else:
+        with open(path, 'w', encoding='utf-8', newline=newline) as f:
+            yield f
+
+
+def _make_client(args: argparse.Namespace, **kwargs) -> RuneClient:
+    if args.fixtures is not None:
+        kwargs['session'] = ReplaySession(load_fixtures(args.fixtures))
+    return RuneClient(parser=args.parser, url=args.url, **kwargs)
+
+
+def _report_errors(errors: dict) -> int:
+    for name, error in errors.items():
+        print('{}: {}'.format(name, error), file=sys.stderr)
+    return 1 if errors else 0
+
+
+def fetch(args: argparse.Namespace) -> int:
+    """Prints the rune pages of the given champions."""
+    client = _make_client(args)
+    result = client.get_runes_many(args.champions, max_workers=args.workers)
+
+    with _open_output(args.output, newline='') as f:
+        if args.format == 'text':
+            for champions in result.runes.values():
+                for champ in champions:
+                    runes = champ.runes
+                    f.write('{0.name}: {0.title} - {1.keystone} ({1.primary.name}/{1.secondary.name})\n'.format(
+                        champ, runes))
+        elif args.format == 'json':
+            json.dump({name: [x.to_dict() for x in champions] for name, champions in result.runes.items()}, f,
+                      indent=2)
+            f.write('\n')
+        elif args.format == 'jsonl':
+            export.write_jsonl(export.iter_rows(result.runes), f)
+        else:
+            export.write_csv(export.iter_rows(result.runes), f)
+
+    return _report_errors(result.errors)
+
+
+def dump(args: argparse.Namespace) -> int:
+    """Fetches every champion and writes them to a snapshot, JSON-lines or CSV file."""
+    client = _make_client(args, cache=RuneCache(maxsize=args.cache_size, ttl=None))
+    start = time.perf_counter()
+    result = client.get_all_runes(max_workers=args.workers)
+
+    if args.format == 'snapshot':
+        if args.output == '-':
+            raise SystemExit('lolrune dump: a snapshot needs a file, pass --output')
+        client.save_snapshot(args.output)
+    else:
+        write = export.write_jsonl if args.format == 'jsonl' else export.write_csv
+        with _open_output(args.output, newline='') as f:
+            write(export.iter_rows(result.runes), f)
+
+    print('Dumped {} champions in {:.2f}s to {}'.format(len(result.runes), time.perf_counter() - start, args.output),
+          file=sys.stderr)
+    return _report_errors(result.errors)
+
+
+def bench(args: argparse.Namespace) -> int:
+    """Times the fetch, parse and build stages, against fixtures or a live site."""
+    if args.live:
+        stats = ClientStats()
+        client = _make_client(args, stats=stats)
+        start = time.perf_counter()
+        result = client.get_all_runes(max_workers=args.workers)
+        report = {'meta': {'lolrune': __version__, 'url': client.URL, 'parser': args.parser,
+                           'workers': args.workers, 'timestamp': time.time()},
+                  'total_s': time.perf_counter() - start,
+                  'champions': len(result.runes),
+                  'errors': len(result.errors),
+                  'stats': stats.to_dict()}
+    else:
+        report = run_benchmarks(args.fixtures or FIXTURES_DIR, args.rounds)
+
+    with _open_output(args.output) as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='lolrune', description=__doc__.splitlines()[0])
+    parser.add_argument('--version', action='version', version='%(prog)s {}'.format(__version__))
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--fixtures', metavar='DIR',
+                        help='serve saved pages from a fixture directory containing an index.json instead of the site')
+    common.add_argument('--url', help='base URL to fetch from instead of runeforge.gg')
+    common.add_argument('--parser', choices=('bs4', 'lxml'), default='lxml', help='html parser backend')
+    common.add_argument('-j', '--workers', type=int, default=8, help='number of pages fetched at once')
+    common.add_argument('-o', '--output', default='-', help='file to write to, - for stdout')
+
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    fetch_parser = subparsers.add_parser('fetch', parents=[common], help=fetch.__doc__.rstrip('.'))
+    fetch_parser.add_argument('champions', nargs='+', metavar='champion', help='champion name, loosely matched')
+    fetch_parser.add_argument('-f', '--format', choices=('text', 'json', 'jsonl', 'csv'), default='text')
+    fetch_parser.set_defaults(func=fetch)
+
+    dump_parser = subparsers.add_parser('dump', parents=[common], help=dump.__doc__.rstrip('.'))
+    dump_parser.add_argument('-f', '--format', choices=('snapshot', 'jsonl', 'csv'), default='snapshot')
+    dump_parser.add_argument('--cache-size', type=int, default=4096, help='the most loadouts kept for a snapshot')
+    dump_parser.set_defaults(func=dump)
+
+    bench_parser = subparsers.add_parser('bench', parents=[common], help=bench.__doc__.rstrip('.'))
+    bench_parser.add_argument('--live', action='store_true',
+                              help='time a full fetch over the network, or --fixtures, instead of the offline suite')
+    bench_parser.add_argument('--rounds', type=int, default=20, help='number of timed rounds offline')
+    bench_parser.set_defaults(func=bench)
+
+    return parser
+
+
+def main(argv: Sequence[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except LoLRuneException as e:
+        print('lolrune: {}'.format(e), file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away, e.g. ``lolrune bench | head``. Stdout is flushed again
+        # at exit, so point it at devnull to keep that from failing too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
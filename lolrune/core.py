@@ -0,0 +1,363 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from . import snapshot, utils
+from .cache import RuneCache
+from .errors import *
+from .names import ChampionResolver
+from .ratelimit import RateLimiter
+from .refresh import ChampDiff, RefreshStats, diff_rune_links
+from .retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from .runepage import BulkResult, Champion
+from .stats import ClientStats
+
+log = logging.getLogger(__name__)
+
+
+class RuneEngine:
+    """The transport-agnostic core shared by :class:`RuneClient` and :class:`AioRuneClient`.
+
+    The engine owns everything which does not depend on how requests are made: champion resolution,
+    caching, conditional request validators, response checking, retry and circuit breaker bookkeeping,
+    instrumentation and model building. The clients only add the I/O, blocking or awaitable, around it,
+    so a feature added here behaves the same way in both.
+
+    Parameters
+    ----------
+    cache : :class:`RuneCache`, optional
+        A cache for parsed loadout pages, keyed by URL.
+
+    parser : str, optional
+        The html parser backend, either ``'bs4'`` or ``'lxml'``. Defaults to ``'bs4'``.
+
+    retry : :class:`RetryPolicy`, optional
+        How transient failures are retried. Defaults to ``RetryPolicy()``.
+
+    circuit_breaker : :class:`CircuitBreaker`, optional
+        Stops requests for a while after repeated failures. Defaults to ``CircuitBreaker()``.
+
+    serve_stale : bool, optional
+        Whether a loadout page which cannot be fetched is served from its last known version in ``cache``.
+        Defaults to ``False``.
+
+    stats : :class:`ClientStats`, optional
+        Collects request counts and per-stage timings.
+
+    url : str, optional
+        The base URL to request instead of ``URL``. A trailing slash is added if it is missing.
+
+    rate_limiter : :class:`RateLimiter`, optional
+        Limits how fast requests are made. It can be shared between clients.
+    """
+    HEADERS = {'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:57.0) Gecko/20100101 Firefox/57.0'}
+    URL = 'http://runeforge.gg/'
+
+    def __init__(self, cache: RuneCache = None, parser: str = 'bs4', retry: RetryPolicy = None,
+                 circuit_breaker: CircuitBreaker = None, serve_stale: bool = False, stats: ClientStats = None,
+                 url: str = None, rate_limiter: RateLimiter = None):
+        if url is not None:
+            self.URL = url if url.endswith('/') else url + '/'
+        self.cache = cache
+        self._parser = utils.get_parser(parser)
+        self.retry = RetryPolicy() if retry is None else retry
+        self.circuit_breaker = CircuitBreaker() if circuit_breaker is None else circuit_breaker
+        self.serve_stale = serve_stale
+        self.stats = stats
+        self.rate_limiter = rate_limiter
+        self._headers = self.HEADERS
+        # url -> the validators of its last 200 response. Only the small header values are kept,
+        # the parsed result of a 304 comes from the cache, or rune_links for the homepage
+        self._validators = {}
+        # url -> the fetch in progress, shared by every caller asking for the page meanwhile
+        self._inflight = {}
+        self.refresh_stats = RefreshStats()
+        self.rune_links = {}
+
+    @staticmethod
+    def _snapshot_is_stale(snap: snapshot.Snapshot, max_age: Optional[float]) -> bool:
+        """Returns whether a snapshot is older than ``max_age``, see ``from_snapshot``."""
+        return max_age is not None and time.time() - snap.created > max_age
+
+    @staticmethod
+    def _load_snapshot_cache(snap: snapshot.Snapshot, cache: RuneCache = None, stale: bool = False) -> RuneCache:
+        """Loads a snapshot's pages into ``cache``, creating a :class:`RuneCache` if none is passed.
+
+        A :class:`RuneCache` is told how old the pages are, so they expire as if they had been cached when
+        the snapshot was written, and pages of a stale snapshot are revalidated before use.
+        Other caches have no notion of age, so they are only given the pages of a snapshot which is not stale.
+        """
+        if cache is None:
+            cache = RuneCache()
+
+        if isinstance(cache, RuneCache):
+            age = max(time.time() - snap.created, 0.0)
+            for url, page in snap.pages.items():
+                cache.set(url, page, age=age)
+        elif not stale:
+            for url, page in snap.pages.items():
+                cache.set(url, page)
+
+        return cache
+
+    @property
+    def rune_links(self) -> dict:
+        return self._resolver.rune_links
+
+    @rune_links.setter
+    def rune_links(self, rune_links: dict):
+        # The resolver is built before it is swapped in, so lookups never see a partial index
+        self._resolver = ChampionResolver(rune_links)
+
+    def save_snapshot(self, path: str):
+        """Writes ``rune_links`` and every page held in ``self.cache`` to a snapshot file.
+        Use :meth:`get_all_runes` first to snapshot the whole roster.
+
+        Parameters
+        ----------
+        path : str
+            Where to write the snapshot.
+        """
+        pages = [] if self.cache is None else [page for _, page in self.cache.items()]
+        snapshot.save_snapshot(path, self.rune_links, pages)
+
+    def _observe(self, stage: str, start: Optional[float]):
+        """Records the time since ``start`` under ``stage``, if instrumentation is enabled."""
+        if self.stats is not None:
+            self.stats.observe(stage, time.perf_counter() - start)
+
+    def _record_refresh(self, started: float, start: float, error: Exception = None):
+        """Records a background refresh of ``rune_links`` in ``refresh_stats``, logging it if it failed."""
+        self.refresh_stats.record(started, time.perf_counter() - start, error)
+        if error is not None:
+            log.error('Failed to refresh rune_links from %s', self.URL, exc_info=error)
+
+    # Requests
+
+    def _request_headers(self, headers: Optional[dict]) -> dict:
+        return {**self._headers, **headers} if headers else self._headers
+
+    def _response(self, status: int, headers: Any, text: Optional[str], size: int,
+                  conditional: bool) -> utils.Response:
+        """Checks the status of a response, see ``_get``.
+
+        Raises
+        ------
+        RuneConnectionError
+            If the status is not 200, or 304 for a conditional request.
+        """
+        if status == 200 or (status == 304 and conditional):
+            return utils.Response(status=status, headers=headers, text=text, size=size)
+        raise RuneConnectionError(status, retry_after=parse_retry_after(headers.get('Retry-After')))
+
+    def _attempt_failed(self, url: str, attempt: int, error: Exception, start: Optional[float]) -> Optional[float]:
+        """Records a failed GET attempt and returns how long to wait before retrying it, or ``None`` to give up."""
+        if self.stats is not None:
+            self._observe('fetch', start)
+            self.stats.record_error(error.status if isinstance(error, RuneConnectionError) else None)
+
+        # A non-retryable status still means the server is up
+        if self.retry.is_retryable(error):
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        delay = self.retry.next_delay(attempt, error)
+        if delay is not None:
+            log.debug('Retrying %s in %.2fs after %r', url, delay, error)
+        return delay
+
+    def _attempt_succeeded(self, resp: utils.Response, start: Optional[float]):
+        """Records a GET attempt which got a usable response."""
+        if self.stats is not None:
+            self._observe('fetch', start)
+            self.stats.record_response(resp.status, resp.size)
+        self.circuit_breaker.record_success()
+
+    def _conditional_headers(self, url: str, previous: Any) -> dict:
+        """Returns the headers revalidating ``url``, or none if there is no ``previous`` result to reuse on a 304."""
+        if previous is None:
+            return {}
+        return utils.conditional_headers(self._validators.get(url))
+
+    @contextmanager
+    def _parsing(self, url: str) -> Iterator[None]:
+        """Times the parsing of ``url``, wrapping any error the parser raises in a :class:`RuneParseError`."""
+        start = time.perf_counter() if self.stats is not None else None
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise RuneParseError(url, repr(e)) from e
+        self._observe('parse', start)
+
+    def _parse_response(self, url: str, resp: utils.Response, parser: Callable[[str], Any], previous: Any) -> Any:
+        """Returns ``previous`` for a 304 response, otherwise parses the response and remembers its validators,
+        see ``_get_parsed``.
+        """
+        if resp.status == 304:
+            return previous
+
+        with self._parsing(url):
+            result = parser(resp.text)
+        return self._remember(url, resp, result)
+
+    def _remember(self, url: str, resp: utils.Response, result: Any) -> Any:
+        """Stores the validators of a parsed response for the next conditional request, returning ``result``."""
+        # Without a cache there is never a previous loadout page to revalidate, only rune_links
+        if self.cache is None and url != self.URL:
+            return result
+
+        validator = utils.make_validator(resp.headers)
+        if validator is None:
+            self._validators.pop(url, None)
+        else:
+            self._validators[url] = validator
+        return result
+
+    # Champions
+
+    def _resolve(self, champion_name: str, resolver: ChampionResolver = None) -> str:
+        """Resolves a champion name to its ``rune_links`` key, see ``resolve_champion``."""
+        if resolver is None:
+            resolver = self._resolver
+        champion_key = resolver.resolve(champion_name)
+        if champion_key is None:
+            raise ChampNotFoundError(champion_name)
+        return champion_key
+
+    def _champion_urls(self, champion_name: str) -> List[str]:
+        """Resolves a champion name to its loadout URLs."""
+        # Read the resolver once, so a concurrent update_champs cannot swap it mid-lookup
+        resolver = self._resolver
+        return resolver.rune_links[self._resolve(champion_name, resolver)]
+
+    def _resolve_urls(self, champion_names: Iterable[str]) -> List[str]:
+        """Resolves champion names to the distinct loadout URLs of them all, keeping their order."""
+        resolver = self._resolver
+        urls = []
+        for name in champion_names:
+            urls.extend(resolver.rune_links[self._resolve(name, resolver)])
+        return list(dict.fromkeys(urls))
+
+    @staticmethod
+    def _distinct(champion_names: Iterable[str]) -> List[str]:
+        """Drops duplicate names while keeping the requested order."""
+        return list(dict.fromkeys(champion_names))
+
+    def _apply_links(self, rune_links: dict) -> ChampDiff:
+        """Swaps in a freshly parsed ``rune_links``, dropping the pages of loadouts which are gone.
+
+        Raises
+        ------
+        LoLRuneException
+            If ``rune_links`` is empty. The current index is left untouched.
+        """
+        if not rune_links:
+            raise LoLRuneException('No champions found on {}'.format(self.URL))
+
+        diff = diff_rune_links(self.rune_links, rune_links)
+        self.rune_links = rune_links
+        self._forget_urls(diff.stale_urls)
+        return diff
+
+    def _forget_urls(self, urls: Iterable[str]):
+        """Drops the cached pages and validators of loadouts which are no longer listed."""
+        for url in urls:
+            self._validators.pop(url, None)
+            if self.cache is not None:
+                self.cache.pop(url)
+
+    # Loadout pages
+
+    def _cached_page(self, url: str) -> Optional[dict]:
+        """Returns the page cached under ``url``, or ``None``."""
+        if self.cache is None:
+            return None
+
+        rune_page = self.cache.get(url)
+        if rune_page is not None and self.stats is not None:
+            self.stats.record_lookup(hit=True)
+        return rune_page
+
+    def _recheck_cache(self, url: str) -> Optional[dict]:
+        """Looks up a page again after a miss in ``_cached_page``.
+        A cache which supports ``in`` is asked that first, so the second lookup is not counted as another miss.
+        """
+        if self.cache is None:
+            return None
+        contains = getattr(self.cache, '__contains__', None)
+        if contains is not None and not contains(url):
+            return None
+        return self._cached_page(url)
+
+    def _store_page(self, url: str, rune_page: dict) -> dict:
+        if self.cache is not None:
+            self.cache.set(url, rune_page)
+        return rune_page
+
+    def _previous_page(self, url: str) -> Optional[dict]:
+        """Returns the last version of a loadout page still held by ``self.cache``, even if it expired, or ``None``."""
+        get_stale = getattr(self.cache, 'get_stale', None)
+        return None if get_stale is None else get_stale(url)
+
+    def _page_parser(self, url: str) -> Callable[[str], dict]:
+        return partial(self._parser.page, url=url)
+
+    def _stale_page(self, url: str, error: RuneConnectionError) -> dict:
+        """Returns the last known version of a loadout page which could not be fetched if ``serve_stale`` is set.
+
+        Raises
+        ------
+        RuneConnectionError
+            ``error``, if ``serve_stale`` is not set or there is no such version.
+        """
+        rune_page = self._previous_page(url) if self.serve_stale else None
+        if rune_page is None:
+            raise error
+
+        log.warning('Serving a stale copy of %s', url)
+        return rune_page
+
+    @staticmethod
+    def _log_prefetch(urls: Iterable[str], results: Iterable[Any]):
+        """Logs the loadouts ``update_champs`` failed to prefetch. Errors which are not the library's are raised."""
+        for url, result in zip(urls, results):
+            if isinstance(result, LoLRuneException):
+                log.warning('Failed to prefetch %s: %r', url, result)
+            elif isinstance(result, BaseException):
+                raise result
+
+    def _build(self, rune_page: dict) -> Champion:
+        if self.stats is None:
+            return Champion(rune_page)
+
+        start = time.perf_counter()
+        champion = Champion(rune_page)
+        self._observe('build', start)
+        return champion
+
+    def _build_all(self, rune_pages: Iterable[dict]) -> tuple:
+        if self.stats is None:
+            return tuple(Champion(x) for x in rune_pages)
+
+        start = time.perf_counter()
+        champions = tuple(Champion(x) for x in rune_pages)
+        self._observe('build', start)
+        return champions
+
+    @staticmethod
+    def _bulk_result(names: Sequence[str], results: Sequence[Any]) -> BulkResult:
+        """Splits per-champion results into runes and errors, see ``get_runes_many``."""
+        runes = {}
+        errors = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                errors[name] = result
+            else:
+                runes[name] = result
+        return BulkResult(runes=runes, errors=errors)
@@ -6,16 +6,44 @@ class LoLRuneException(Exception):
 
 
 class RuneConnectionError(LoLRuneException, ConnectionError):
-    """Raised when a request does not have a status of 200.
+    """Raised when a request does not have a status of 200, or fails to complete at all.
 
     Parameters
     ----------
-    status : int
-        The status of the request which failed.
+    status : Optional[int]
+        The status of the request which failed, or ``None`` if there was no response.
+
+    reason : str, optional
+        Why the request failed when there was no response, e.g. a timeout.
+
+    retry_after : float, optional
+        The number of seconds the server asked to wait before retrying, if any.
+    """
+
+    def __init__(self, status, reason=None, retry_after=None):
+        self.status = status
+        self.retry_after = retry_after
+        if status is None:
+            self.message = 'Runeforge.gg failed to respond: {}'.format(reason)
+        else:
+            self.message = 'Runeforge.gg failed to respond with status {}.'.format(status)
+        super().__init__(self.message)
+
+
+class CircuitOpenError(RuneConnectionError):
+    """Raised instead of making a request while runeforge.gg is considered down, see :class:`CircuitBreaker`.
+
+    Parameters
+    ----------
+    retry_in : float
+        The number of seconds until requests are allowed again.
     """
 
-    def __init__(self, status):
-        self.message = 'Runeforge.gg failed to respond with status {}.'.format(status)
+    def __init__(self, retry_in):
+        self.status = None
+        self.retry_after = retry_in
+        self.message = 'Runeforge.gg is considered down, not retrying for {:.1f}s.'.format(retry_in)
+        LoLRuneException.__init__(self, self.message)
 
 
 class ChampNotFoundError(LoLRuneException, KeyError):
@@ -30,3 +58,38 @@ class ChampNotFoundError(LoLRuneException, KeyError):
     def __init__(self, champ):
         self.message = 'No champs matching {}'.format(champ)
         super().__init__(self.message)
+
+
+class RuneParseError(LoLRuneException):
+    """Raised when a page cannot be parsed, usually because runeforge.gg changed its layout.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the page which could not be parsed.
+
+    reason : str
+        The error raised by the parser.
+    """
+
+    def __init__(self, url, reason):
+        self.url = url
+        self.message = 'Could not parse {}: {}'.format(url, reason)
+        super().__init__(self.message)
+
+
+class SnapshotError(LoLRuneException):
+    """Raised when a snapshot file cannot be loaded.
+
+    Parameters
+    ----------
+    path : str
+        The path of the snapshot file.
+
+    reason : str
+        Why the snapshot could not be loaded.
+    """
+
+    def __init__(self, path, reason):
+        self.message = 'Could not load snapshot {}: {}'.format(path, reason)
+        super().__init__(self.message)
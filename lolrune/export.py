@@ -0,0 +1,198 @@
+import csv
+import json
+from array import array
+from typing import IO, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .runepage import Champion
+
+PRIMARY_SLOTS = 3
+SECONDARY_SLOTS = 2
+
+COLUMNS = (('champion', 'name', 'title', 'url', 'primary', 'keystone')
+           + tuple('primary_{}'.format(i + 1) for i in range(PRIMARY_SLOTS))
+           + ('secondary',)
+           + tuple('secondary_{}'.format(i + 1) for i in range(SECONDARY_SLOTS)))
+"""The columns of an export, in order. Rune slots missing from a page are empty."""
+
+Loadout = Union[dict, Champion]
+
+
+def _slots(runes: Sequence[str], count: int) -> list:
+    return [runes[i] if i < len(runes) else None for i in range(count)]
+
+
+def iter_rows(runes: Mapping[str, Iterable[Loadout]]) -> Iterator[tuple]:
+    """A generator which flattens loadouts into rows of :data:`COLUMNS`, one per loadout.
+
+    Parameters
+    ----------
+    runes : Mapping[str, Iterable[Union[dict, :class:`Champion`]]]
+        The loadouts of each champion, keyed by champion, either raw as returned by ``get_raw``,
+        or as :class:`Champion`\\s. The ``runes`` of a :obj:`BulkResult` can be passed directly.
+
+    Yields
+    ------
+    tuple
+        A row of strings, with ``None`` for missing rune slots.
+    """
+    for champion, loadouts in runes.items():
+        for loadout in loadouts:
+            if isinstance(loadout, Champion):
+                # Read through the views, to_dict would copy the whole page
+                page = loadout.runes
+                primary, secondary = page.primary, page.secondary
+                yield tuple([champion, loadout.name, loadout.title, loadout.url, primary.name, page.keystone]
+                            + _slots(primary.runes, PRIMARY_SLOTS)
+                            + [secondary.name]
+                            + _slots(secondary.runes, SECONDARY_SLOTS))
+                continue
+
+            primary = loadout['runes']['primary']
+            secondary = loadout['runes']['secondary']
+            yield tuple([champion, loadout['name'], loadout['title'], loadout['url'], primary['name'],
+                         primary['keystone']]
+                        + _slots(primary['rest'], PRIMARY_SLOTS)
+                        + [secondary['name']]
+                        + _slots(secondary['rest'], SECONDARY_SLOTS))
+
+
+class RuneTable:
+    """A columnar, dictionary-encoded table of loadouts, for analytics.
+
+    Every column is an :class:`array.array` of integer codes into :attr:`strings`, a vocabulary shared
+    by all columns, so each distinct champion, tree and rune name is stored once.
+    Missing values are encoded as ``-1``.
+
+    Parameters
+    ----------
+    strings : List[str], optional
+        The vocabulary the codes index into.
+
+    columns : Dict[str, array], optional
+        The code column of each name in :data:`COLUMNS`.
+
+    Attributes
+    ----------
+    strings : List[str]
+        The vocabulary the codes index into.
+
+    columns : Dict[str, :class:`array.array`]
+        The code column of each name in :data:`COLUMNS`.
+    """
+
+    def __init__(self, strings: List[str] = None, columns: Dict[str, array] = None):
+        self.strings = strings if strings is not None else []
+        self.columns = columns if columns is not None else {name: array('i') for name in COLUMNS}
+        self._codes = {value: code for code, value in enumerate(self.strings)}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> 'RuneTable':
+        """Encodes rows of :data:`COLUMNS`, e.g. from :func:`iter_rows`, into a table."""
+        table = cls()
+        codes = table._codes
+        columns = [table.columns[name] for name in COLUMNS]
+        strings = table.strings
+
+        for row in rows:
+            for column, value in zip(columns, row):
+                if value is None:
+                    column.append(-1)
+                    continue
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(strings)
+                    strings.append(value)
+                column.append(code)
+
+        return table
+
+    @classmethod
+    def from_runes(cls, runes: Mapping[str, Iterable[Loadout]]) -> 'RuneTable':
+        """Encodes loadouts into a table, see :func:`iter_rows` for the accepted input.
+
+        Parameters
+        ----------
+        runes : Mapping[str, Iterable[Union[dict, :class:`Champion`]]]
+            The loadouts of each champion, keyed by champion.
+
+        Returns
+        -------
+        :class:`RuneTable`
+            The encoded table.
+        """
+        return cls.from_rows(iter_rows(runes))
+
+    def __repr__(self) -> str:
+        return '<RuneTable rows={} strings={}>'.format(len(self), len(self.strings))
+
+    def __len__(self) -> int:
+        return len(self.columns[COLUMNS[0]])
+
+    def decode(self, column: str) -> List[Optional[str]]:
+        """Returns a column as a list of strings, with ``None`` for missing values."""
+        strings = self.strings
+        return [strings[code] if code >= 0 else None for code in self.columns[column]]
+
+    def code(self, value: str) -> int:
+        """Returns the code of ``value``, or ``-1`` if it does not occur in the table, e.g. to filter a column."""
+        return self._codes.get(value, -1)
+
+    def rows(self) -> Iterator[tuple]:
+        """A generator which decodes the table back into rows of :data:`COLUMNS`."""
+        strings = self.strings
+        for codes in zip(*(self.columns[name] for name in COLUMNS)):
+            yield tuple(strings[code] if code >= 0 else None for code in codes)
+
+
+def write_csv(rows: Iterable[tuple], file: IO[str], header: bool = True) -> int:
+    """A function which streams rows to a CSV file, one at a time.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple]
+        Rows of :data:`COLUMNS`, e.g. from :func:`iter_rows` or :meth:`RuneTable.rows`.
+
+    file : IO[str]
+        A text file opened with ``newline=''``.
+
+    header : bool, optional
+        Whether to write the column names first. Defaults to ``True``.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    writer = csv.writer(file)
+    if header:
+        writer.writerow(COLUMNS)
+
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[tuple], file: IO[str]) -> int:
+    """A function which streams rows to a JSON-lines file, one object per line.
+
+    Parameters
+    ----------
+    rows : Iterable[tuple]
+        Rows of :data:`COLUMNS`, e.g. from :func:`iter_rows` or :meth:`RuneTable.rows`.
+
+    file : IO[str]
+        A text file.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(COLUMNS, row))))
+        file.write('\n')
+        count += 1
+    return count
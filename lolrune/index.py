@@ -0,0 +1,217 @@
+import threading
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional
+
+from .runepage import Champion
+
+_EMPTY = frozenset()
+
+
+class RuneIndex:
+    """An in-memory reverse index over loaded rune pages, which answers questions like
+    "which champions run Electrocute?" without scanning every :class:`Champion`.
+
+    Every lookup returns a :class:`frozenset` of :class:`Champion`\\s, one per loadout, in constant time.
+    Pages are grouped under a key, usually the champion name they were requested with,
+    so one champion's pages can be replaced without rebuilding the index.
+
+    Parameters
+    ----------
+    champions : Mapping[str, Iterable[:class:`Champion`]], optional
+        The pages to index, keyed by champion. The ``runes`` of a :obj:`BulkResult` can be passed directly.
+
+    Note
+    ----
+    Lookups never block. Each posting set is replaced atomically, never mutated in place,
+    so a lookup during an update sees a complete set. Updates are serialized with a lock.
+    """
+
+    def __init__(self, champions: Mapping[str, Iterable[Champion]] = None):
+        self._pages = {}
+        self._by_keystone = {}
+        self._by_primary = {}
+        self._by_secondary = {}
+        self._by_rune = {}
+        self._all = _EMPTY
+        # page -> the number of keys it is indexed under, since equal pages may appear under several keys
+        self._refs = Counter()
+        self._lock = threading.Lock()
+
+        for key, pages in (champions or {}).items():
+            self.update(key, pages)
+
+    @classmethod
+    def from_champions(cls, champions: Iterable[Champion]) -> 'RuneIndex':
+        """Creates an index from loose :class:`Champion`\\s, grouping them by :attr:`Champion.name`.
+
+        Parameters
+        ----------
+        champions : Iterable[:class:`Champion`]
+            The pages to index.
+
+        Returns
+        -------
+        :class:`RuneIndex`
+            The new index.
+        """
+        grouped = {}
+        for champ in champions:
+            grouped.setdefault(champ.name, []).append(champ)
+        return cls(grouped)
+
+    def __repr__(self) -> str:
+        return '<RuneIndex champions={} pages={}>'.format(len(self._pages), len(self._all))
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._pages
+
+    @staticmethod
+    def _postings(page: Champion) -> Iterable[tuple]:
+        """Yields the ``(attribute name, value)`` pairs a page is indexed under."""
+        runes = page.runes
+        yield '_by_keystone', runes.keystone
+        yield '_by_primary', runes.primary.name
+        yield '_by_secondary', runes.secondary.name
+        yield '_by_rune', runes.keystone
+        for rune in runes.primary.runes + runes.secondary.runes:
+            yield '_by_rune', rune
+
+    def _change(self, pages: Iterable[Champion], add: bool):
+        """Adds or removes pages from every posting set they belong to."""
+        for page in pages:
+            for attr, value in self._postings(page):
+                postings = getattr(self, attr)
+                current = postings.get(value, _EMPTY)
+                # Sets are replaced rather than mutated, so readers never see a half-applied update
+                updated = current | {page} if add else current - {page}
+                if updated:
+                    postings[value] = updated
+                else:
+                    postings.pop(value, None)
+
+    def _replace(self, key: str, pages: tuple):
+        """Swaps the pages under ``key``, only touching pages which are new to, or gone from, the whole index."""
+        old = self._pages.pop(key, ())
+        if pages:
+            self._pages[key] = pages
+
+        removed = []
+        for page in set(old):
+            self._refs[page] -= 1
+            if not self._refs[page]:
+                del self._refs[page]
+                removed.append(page)
+
+        added = []
+        for page in set(pages):
+            if not self._refs[page]:
+                added.append(page)
+            self._refs[page] += 1
+
+        self._change(removed, add=False)
+        self._change(added, add=True)
+        self._all = (self._all - set(removed)) | set(added)
+
+    def update(self, key: str, pages: Iterable[Champion]):
+        """Replaces the pages indexed under ``key``, e.g. after a champion's pages were refreshed.
+
+        Parameters
+        ----------
+        key : str
+            The champion the pages belong to.
+
+        pages : Iterable[:class:`Champion`]
+            The champion's current pages.
+        """
+        pages = tuple(pages)
+        with self._lock:
+            self._replace(key, pages)
+
+    def remove(self, key: str):
+        """Removes every page indexed under ``key``. Unknown keys are ignored.
+
+        Parameters
+        ----------
+        key : str
+            The champion to remove.
+        """
+        with self._lock:
+            self._replace(key, ())
+
+    def pages(self, key: str) -> tuple:
+        """Returns the pages indexed under ``key``, or an empty tuple."""
+        return self._pages.get(key, ())
+
+    def by_keystone(self, keystone: str) -> FrozenSet[Champion]:
+        """Returns every page with ``keystone`` as its keystone, e.g. ``'Electrocute'``."""
+        return self._by_keystone.get(keystone, _EMPTY)
+
+    def by_primary(self, tree: str) -> FrozenSet[Champion]:
+        """Returns every page with ``tree`` as its primary tree, e.g. ``'Domination'``."""
+        return self._by_primary.get(tree, _EMPTY)
+
+    def by_secondary(self, tree: str) -> FrozenSet[Champion]:
+        """Returns every page with ``tree`` as its secondary tree, e.g. ``'Sorcery'``."""
+        return self._by_secondary.get(tree, _EMPTY)
+
+    def by_rune(self, rune: str) -> FrozenSet[Champion]:
+        """Returns every page which takes ``rune``, keystones included, e.g. ``'Ravenous Hunter'``."""
+        return self._by_rune.get(rune, _EMPTY)
+
+    def query(self, keystone: Optional[str] = None, primary: Optional[str] = None, secondary: Optional[str] = None,
+              runes: Iterable[str] = ()) -> FrozenSet[Champion]:
+        """Returns the pages matching every given filter. With no filters, every page is returned.
+
+        Parameters
+        ----------
+        keystone : str, optional
+            The keystone the pages must use.
+
+        primary : str, optional
+            The primary tree the pages must use.
+
+        secondary : str, optional
+            The secondary tree the pages must use.
+
+        runes : Iterable[str], optional
+            Runes the pages must all take.
+
+        Returns
+        -------
+        FrozenSet[:class:`Champion`]
+            The matching pages.
+        """
+        candidates = [self.by_rune(x) for x in runes]
+        if keystone is not None:
+            candidates.append(self.by_keystone(keystone))
+        if primary is not None:
+            candidates.append(self.by_primary(primary))
+        if secondary is not None:
+            candidates.append(self.by_secondary(secondary))
+
+        if not candidates:
+            return self._all
+
+        # Intersecting from the smallest set keeps the work proportional to the result
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def champions(self, **filters) -> Dict[str, tuple]:
+        """Like :meth:`query`, but groups the matching pages by the key they were indexed under.
+
+        Parameters
+        ----------
+        \\*\\*filters
+            Passed on to :meth:`query`.
+
+        Returns
+        -------
+        Dict[str, Tuple[:class:`Champion`]]
+            The matching pages of each champion with at least one match.
+        """
+        matches = self.query(**filters)
+        return {key: tuple(x for x in pages if x in matches)
+                for key, pages in self._pages.items() if any(x in matches for x in pages)}
@@ -0,0 +1,189 @@
+import re
+from bisect import bisect_left
+from itertools import combinations
+from typing import Dict, List, Optional, Set
+
+# Common names and nicknames which do not normalize to runeforge's keys
+ALIASES = {
+    'wukong': 'monkeyking',
+    'mundo': 'drmundo',
+    'nunuwillump': 'nunu',
+    'nunuandwillump': 'nunu',
+    'j4': 'jarvaniv',
+    'jarvan': 'jarvaniv',
+    'tf': 'twistedfate',
+    'mf': 'missfortune',
+    'asol': 'aurelionsol',
+    'lee': 'leesin',
+    'yi': 'masteryi',
+    'tk': 'tahmkench',
+    'cait': 'caitlyn',
+    'ez': 'ezreal',
+    'voli': 'volibear',
+}
+
+_NON_ALNUM = re.compile('[^a-z0-9]+')
+
+
+def normalize(name: str) -> str:
+    """A function which reduces a champion name to the form used by ``rune_links`` keys,
+    e.g. ``"Kai'Sa"`` becomes ``'kaisa'`` and ``'Dr. Mundo'`` becomes ``'drmundo'``.
+
+    Parameters
+    ----------
+    name : str
+        The champion name.
+
+    Returns
+    -------
+    str
+        The lowercased name with everything but letters and digits removed.
+    """
+    return _NON_ALNUM.sub('', name.lower())
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Returns ``word`` and every string made by deleting up to ``max_distance`` characters from it."""
+    variants = {word}
+    for n in range(1, min(max_distance, len(word) - 1) + 1):
+        for positions in combinations(range(len(word)), n):
+            variants.add(''.join(c for i, c in enumerate(word) if i not in positions))
+    return variants
+
+
+def _distance(a: str, b: str) -> int:
+    """Returns the edit distance between ``a`` and ``b``, counting an adjacent transposition as one edit."""
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class ChampionResolver:
+    """A precomputed index which resolves loosely typed champion names to ``rune_links`` keys.
+
+    Names are tried, in order, as an exact match after :func:`normalize`, as a known alias,
+    as the prefix of a single champion, and finally as the closest champion by edit distance.
+    Every step is a dict lookup or a binary search, so a lookup never scans the roster.
+
+    Parameters
+    ----------
+    rune_links : dict
+        The champion index to resolve names against.
+
+    max_distance : int, optional
+        The largest edit distance accepted for names of at least 5 characters.
+        Shorter names accept a single edit. Defaults to 2.
+
+    Attributes
+    ----------
+    rune_links : dict
+        The champion index the resolver was built from.
+    """
+
+    def __init__(self, rune_links: dict, max_distance: int = 2):
+        self.rune_links = rune_links
+        self.max_distance = max_distance
+
+        self._exact = {}
+        for key in rune_links:
+            self._exact.setdefault(normalize(key), key)
+        for alias, target in ALIASES.items():
+            if target in self._exact:
+                self._exact.setdefault(alias, self._exact[target])
+
+        self._sorted = sorted(self._exact)
+        self._longest = max(map(len, self._sorted), default=0)
+
+        # Symmetric delete index: a name within max_distance edits of a key
+        # shares at least one deletion variant with it
+        self._deletes = {}  # type: Dict[str, Set[str]]
+        for name in self._sorted:
+            for variant in _deletes(name, max_distance):
+                self._deletes.setdefault(variant, set()).add(name)
+
+    def __repr__(self) -> str:
+        return '<ChampionResolver champions={}>'.format(len(self.rune_links))
+
+    def _by_prefix(self, name: str, limit: int = 2) -> List[str]:
+        """Returns up to ``limit`` distinct keys with a name or alias starting with ``name``."""
+        keys = []
+        for i in range(bisect_left(self._sorted, name), len(self._sorted)):
+            candidate = self._sorted[i]
+            if not candidate.startswith(name) or len(keys) >= limit:
+                break
+            key = self._exact[candidate]
+            if key not in keys:
+                keys.append(key)
+        return keys
+
+    def _by_distance(self, name: str) -> Optional[str]:
+        # Deletion variants grow combinatorially with the length of the name,
+        # so names too long to be within reach of any key are rejected up front
+        if len(name) > self._longest + self.max_distance:
+            return None
+
+        max_distance = self.max_distance if len(name) >= 5 else 1
+
+        candidates = set()
+        for variant in _deletes(name, max_distance):
+            candidates.update(self._deletes.get(variant, ()))
+
+        best = None
+        best_distance = max_distance + 1
+        tied = False
+        for candidate in candidates:
+            distance = _distance(name, candidate)
+            key = self._exact[candidate]
+            if distance < best_distance:
+                best, best_distance, tied = key, distance, False
+            elif distance == best_distance and key != best:
+                tied = True
+
+        return None if tied else best
+
+    def resolve(self, champion_name: str) -> Optional[str]:
+        """Resolves a champion name to its ``rune_links`` key.
+
+        Parameters
+        ----------
+        champion_name : str
+            A champion name or nickname, e.g. ``"Kai'Sa"``, ``'wukong'`` or ``'velkz'``.
+
+        Returns
+        -------
+        Optional[str]
+            The matching key, or ``None`` if the name is unknown or ambiguous.
+        """
+        name = normalize(champion_name)
+        if not name:
+            return None
+
+        key = self._exact.get(name)
+        if key is not None:
+            return key
+
+        # Two matches are enough to tell a unique prefix from an ambiguous one
+        prefixed = self._by_prefix(name)
+        if len(prefixed) == 1 and len(name) >= 3:
+            return prefixed[0]
+        if prefixed:
+            return None
+
+        return self._by_distance(name)
+
+    def urls(self, champion_name: str) -> Optional[List[str]]:
+        """Resolves a champion name and returns its loadout URLs, or ``None`` if it cannot be resolved."""
+        key = self.resolve(champion_name)
+        return None if key is None else self.rune_links[key]
+
+    def suggest(self, champion_name: str, limit: int = 5) -> List[str]:
+        """Returns up to ``limit`` keys with a name or alias starting with ``champion_name``, e.g. to autocomplete."""
+        return self._by_prefix(normalize(champion_name), limit)
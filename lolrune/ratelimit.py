@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """A token bucket limiting how fast requests are made to runeforge.gg.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per second. Each request takes a token,
+    waiting for one if the bucket is empty. Waiting requests are served in the order they arrived.
+
+    A limiter is thread-safe and is not bound to an event loop, so one limiter can be shared by any number
+    of :class:`RuneClient`\\s and :class:`AioRuneClient`\\s in a process to keep them under a single budget.
+
+    Parameters
+    ----------
+    rate : float
+        The sustained number of requests per second.
+
+    burst : int, optional
+        The number of requests which may be made at once after a quiet period. Defaults to 1.
+
+    Attributes
+    ----------
+    requests : int
+        The number of requests which took a token.
+
+    throttled : int
+        The number of requests which had to wait for a token.
+
+    throttled_time : float
+        The total number of seconds requests spent waiting for tokens.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.throttled = 0
+        self.throttled_time = 0.0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return ('<RateLimiter rate={0.rate} burst={0.burst} requests={0.requests} '
+                'throttled={0.throttled} throttled_time={0.throttled_time:.3f}>'.format(self))
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how many seconds to wait before using it.
+
+        The bucket may go into debt, which queues later callers behind earlier ones
+        without any of them holding the lock while they wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst) - 1
+            self._updated = now
+            self.requests += 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            delay = -self._tokens / self.rate
+            self.throttled += 1
+            self.throttled_time += delay
+            return delay
+
+    def _refund(self, delay: float):
+        """Gives back a token taken by :meth:`_reserve` which was never used."""
+        with self._lock:
+            self._tokens = min(self._tokens + 1, self.burst)
+            self.requests -= 1
+            if delay:
+                self.throttled -= 1
+                self.throttled_time -= delay
+
+    def acquire(self) -> float:
+        """Waits for a token, blocking the current thread.
+
+        Returns
+        -------
+        float
+            The number of seconds waited.
+        """
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Waits for a token without blocking the event loop.
+        If the wait is cancelled, the token is given back.
+
+        Returns
+        -------
+        float
+            The number of seconds waited.
+        """
+        delay = self._reserve()
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._refund(delay)
+                raise
+        return delay
+
+    def to_dict(self) -> dict:
+        """Returns the throttling metrics as a plain dict, e.g. for exporting them."""
+        return {'rate': self.rate, 'burst': self.burst, 'requests': self.requests,
+                'throttled': self.throttled, 'throttled_time': self.throttled_time}
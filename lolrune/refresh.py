@@ -0,0 +1,152 @@
+import random
+import time
+from typing import FrozenSet, NamedTuple, Optional
+
+
+def next_delay(interval: float, jitter: float) -> float:
+    """A function which spreads refreshes out, so many workers started together do not refresh in lockstep.
+
+    Parameters
+    ----------
+    interval : float
+        The average number of seconds between refreshes.
+
+    jitter : float
+        The largest fraction of ``interval`` added or removed at random, e.g. ``0.1`` for ±10%.
+
+    Returns
+    -------
+    float
+        The number of seconds to wait before the next refresh.
+    """
+    return max(interval * (1 + random.uniform(-jitter, jitter)), 0.0)
+
+
+class RefreshStats:
+    """Timing metrics for the ``rune_links`` refreshes of a client.
+    Every client has one as its ``refresh_stats`` attribute.
+
+    Attributes
+    ----------
+    refreshes : int
+        The number of refreshes which succeeded.
+
+    failures : int
+        The number of refreshes which failed. ``rune_links`` is left untouched when a refresh fails.
+
+    last_started : Optional[float]
+        The unix timestamp the last refresh started at.
+
+    last_success : Optional[float]
+        The unix timestamp the last successful refresh finished at.
+
+    last_duration : Optional[float]
+        How many seconds the last refresh took, successful or not.
+
+    total_duration : float
+        How many seconds all refreshes took combined.
+
+    last_error : Optional[Exception]
+        The exception which failed the last refresh, or ``None`` if it succeeded.
+    """
+
+    def __init__(self):
+        self.refreshes = 0
+        self.failures = 0
+        self.last_started = None  # type: Optional[float]
+        self.last_success = None  # type: Optional[float]
+        self.last_duration = None  # type: Optional[float]
+        self.total_duration = 0.0
+        self.last_error = None  # type: Optional[Exception]
+
+    def __repr__(self) -> str:
+        return ('<RefreshStats refreshes={0.refreshes} failures={0.failures} '
+                'last_duration={0.last_duration}>'.format(self))
+
+    @property
+    def age(self) -> Optional[float]:
+        """Optional[float]: The number of seconds since the last successful refresh, or ``None`` if there was none."""
+        return None if self.last_success is None else time.time() - self.last_success
+
+    def record(self, started: float, duration: float, error: Exception = None):
+        """Records the outcome of a refresh.
+
+        Parameters
+        ----------
+        started : float
+            The unix timestamp the refresh started at.
+
+        duration : float
+            How many seconds the refresh took.
+
+        error : Exception, optional
+            The exception which failed the refresh, if any.
+        """
+        self.last_started = started
+        self.last_duration = duration
+        self.total_duration += duration
+        self.last_error = error
+        if error is None:
+            self.refreshes += 1
+            self.last_success = started + duration
+        else:
+            self.failures += 1
+
+    def to_dict(self) -> dict:
+        """Returns the metrics as a plain dict, e.g. for exporting them."""
+        return {'refreshes': self.refreshes, 'failures': self.failures, 'last_started': self.last_started,
+                'last_success': self.last_success, 'last_duration': self.last_duration,
+                'total_duration': self.total_duration, 'age': self.age}
+
+
+ChampDiff = NamedTuple('ChampDiff', [('added', FrozenSet[str]), ('removed', FrozenSet[str]),
+                                     ('changed', FrozenSet[str]), ('new_urls', FrozenSet[str]),
+                                     ('stale_urls', FrozenSet[str])])
+"""A :func:`namedtuple <collections.namedtuple>` describing how ``rune_links`` changed, returned by ``update_champs``.
+
+Attributes
+----------
+added : FrozenSet[str]
+    Champions which were not in the previous index.
+
+removed : FrozenSet[str]
+    Champions which are no longer in the index.
+
+changed : FrozenSet[str]
+    Champions whose loadout URLs changed.
+
+new_urls : FrozenSet[str]
+    Loadout URLs which were not in the previous index. Only these need fetching.
+
+stale_urls : FrozenSet[str]
+    Loadout URLs which are no longer in the index. Their cached pages are dropped.
+"""
+
+
+def diff_rune_links(old: dict, new: dict) -> ChampDiff:
+    """A function which compares two versions of ``rune_links``.
+
+    Parameters
+    ----------
+    old : dict
+        The previous index.
+
+    new : dict
+        The current index.
+
+    Returns
+    -------
+    :obj:`ChampDiff`
+        The champions and loadout URLs which were added, removed or changed.
+    """
+    if old is new:
+        return ChampDiff(frozenset(), frozenset(), frozenset(), frozenset(), frozenset())
+
+    old_urls = {url for urls in old.values() for url in urls}
+    new_urls = {url for urls in new.values() for url in urls}
+
+    return ChampDiff(added=frozenset(new.keys() - old.keys()),
+                     removed=frozenset(old.keys() - new.keys()),
+                     changed=frozenset(x for x in new.keys() & old.keys() if new[x] != old[x]),
+                     new_urls=frozenset(new_urls - old_urls),
+                     stale_urls=frozenset(old_urls - new_urls))
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Dict, Mapping
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> Dict[str, str]:
+    """A function which loads saved runeforge.gg pages from a fixture directory.
+
+    The directory holds an ``index.json`` mapping each page's URL to an html file, relative to the directory.
+    By default, the fixtures bundled with lolrune are loaded.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The fixture directory to load.
+
+    Returns
+    -------
+    Dict[str, str]
+        The raw html of each saved page, keyed by its URL.
+    """
+    with open(os.path.join(directory, 'index.json'), encoding='utf-8') as f:
+        index = json.load(f)
+
+    pages = {}
+    for url, filename in index.items():
+        with open(os.path.join(directory, filename), encoding='utf-8') as f:
+            pages[url] = f.read()
+
+    return pages
+
+
+class ReplayResponse:
+    """A minimal stand-in for :class:`requests.Response`."""
+
+    def __init__(self, status: int, text: str, headers: dict = None, delay: float = 0.0):
+        self.status_code = status
+        self.headers = headers or {}
+        self.text = text
+        self._delay = delay
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode('utf-8')
+
+
+class AioReplayResponse:
+    """A minimal stand-in for :class:`aiohttp.ClientResponse`, which is also its own context manager."""
+
+    def __init__(self, status: int, text: str, headers: dict = None, delay: float = 0.0):
+        self.status = status
+        self.headers = headers or {}
+        self._text = text
+        self._delay = delay
+
+    async def __aenter__(self) -> 'AioReplayResponse':
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def text(self) -> str:
+        return self._text
+
+    async def read(self) -> bytes:
+        return self._text.encode('utf-8')
+
+
+class ReplaySession:
+    """A stand-in for :class:`requests.Session` which serves saved pages instead of making requests.
+    Pass it as the ``session`` of a :class:`RuneClient` to run it offline.
+
+    Latency and server errors can be injected to measure how a client behaves under them, reproducibly
+    if a ``seed`` is given.
+
+    Parameters
+    ----------
+    pages : Mapping[str, str], optional
+        The raw html of each page, keyed by URL. Defaults to the bundled fixtures, see :func:`load_fixtures`.
+
+    latency : float, optional
+        The number of seconds each response takes. Defaults to 0.
+
+    jitter : float, optional
+        The largest number of seconds added to or removed from ``latency`` at random. Defaults to 0.
+
+    error_rate : float, optional
+        The fraction of requests answered with ``error_status`` instead of the page. Defaults to 0.
+
+    error_status : int, optional
+        The status of injected errors. Defaults to 503.
+
+    retry_after : float, optional
+        Sent as the ``Retry-After`` header of injected errors, if given.
+
+    seed : int, optional
+        Seeds the random latency and errors.
+
+    Attributes
+    ----------
+    requests : int
+        The number of requests served so far.
+
+    errors : int
+        The number of errors injected so far.
+    """
+    response_class = ReplayResponse
+
+    def __init__(self, pages: Mapping[str, str] = None, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, retry_after: float = None, seed: int = None):
+        if pages is None:
+            pages = load_fixtures()
+        self.pages = dict(pages)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0.0)
+
+    def _lookup(self, url: str):
+        self.requests += 1
+        delay = self._delay()
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            headers = {} if self.retry_after is None else {'Retry-After': str(self.retry_after)}
+            return self.response_class(self.error_status, '', headers, delay)
+
+        html = self.pages.get(url)
+        if html is None:
+            return self.response_class(404, '', delay=delay)
+        return self.response_class(200, html, delay=delay)
+
+    def get(self, url: str, **kwargs) -> ReplayResponse:
+        resp = self._lookup(url)
+        if resp._delay:
+            time.sleep(resp._delay)
+        return resp
+
+    def close(self):
+        pass
+
+
+class AioReplaySession(ReplaySession):
+    """A stand-in for :class:`aiohttp.ClientSession` which serves saved pages instead of making requests.
+    Pass it as the ``session`` of an :class:`AioRuneClient` to run it offline.
+    Takes the same arguments as :class:`ReplaySession`. Latency is awaited, so it does not block the loop.
+    """
+    response_class = AioReplayResponse
+
+    def get(self, url: str, **kwargs) -> AioReplayResponse:
+        return self._lookup(url)
+
+    async def close(self):
+        pass
@@ -0,0 +1,165 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+from .errors import CircuitOpenError, RuneConnectionError
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """A function which converts a ``Retry-After`` header into a number of seconds.
+
+    Parameters
+    ----------
+    value : Optional[str]
+        The header, either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    Optional[float]
+        The number of seconds to wait, or ``None`` if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RetryPolicy:
+    """Decides whether, and after how long, a failed request is retried.
+
+    Delays grow exponentially with "full jitter": each one is picked at random between zero and
+    ``backoff * 2 ** attempt``, capped at ``max_backoff``, so clients failing together do not retry together.
+    A ``Retry-After`` header sent by the server takes precedence.
+
+    Parameters
+    ----------
+    retries : int, optional
+        The number of retries after the first attempt. ``0`` disables retrying. Defaults to 3.
+
+    backoff : float, optional
+        The base delay in seconds. Defaults to 0.5.
+
+    max_backoff : float, optional
+        The longest delay in seconds. A ``Retry-After`` asking for longer is not retried. Defaults to 30.
+
+    statuses : FrozenSet[int], optional
+        The response statuses which are retried. Requests which got no response at all are always retried.
+        Defaults to 429 and the 5xx gateway and server errors.
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 statuses: FrozenSet[int] = RETRY_STATUSES):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+
+    def __repr__(self) -> str:
+        return '<RetryPolicy retries={0.retries} backoff={0.backoff} max_backoff={0.max_backoff}>'.format(self)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Returns whether ``error`` is a transient failure, i.e. no response or a retryable status.
+        Errors raised by the HTTP library, such as timeouts, are always transient.
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        status = error.status if isinstance(error, RuneConnectionError) else None
+        return status is None or status in self.statuses
+
+    def next_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Returns how many seconds to wait before retrying a request, or ``None`` if it should not be retried.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of retries made so far.
+
+        error : Exception
+            The error the last attempt failed with.
+        """
+        if attempt >= self.retries or not self.is_retryable(error):
+            return None
+
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Stops requests to runeforge.gg for a while after repeated failures, so an outage fails fast
+    instead of piling retries onto the struggling server.
+
+    After ``threshold`` consecutive failed requests the circuit opens, and every request raises
+    :class:`CircuitOpenError` without being made. Once ``reset_timeout`` has passed, requests are let
+    through again: the first success closes the circuit, and a failure opens it for another ``reset_timeout``.
+
+    A breaker is thread-safe and can be shared between several clients.
+
+    Parameters
+    ----------
+    threshold : int, optional
+        The number of consecutive failures which open the circuit. Defaults to 5.
+
+    reset_timeout : float, optional
+        The number of seconds the circuit stays open for. Defaults to 30.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = None  # type: Optional[float]
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<CircuitBreaker state={0.state!r} failures={0.failures}>'.format(self)
+
+    @property
+    def state(self) -> str:
+        """str: ``'closed'``, ``'open'`` or ``'half-open'``, when requests are let through on trial."""
+        opened_at = self._opened_at
+        if opened_at is None:
+            return 'closed'
+        return 'open' if time.monotonic() < opened_at + self.reset_timeout else 'half-open'
+
+    def before_request(self):
+        """Checks that a request may be made.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open.
+        """
+        opened_at = self._opened_at
+        if opened_at is not None:
+            remaining = opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(remaining)
+
+    def record_success(self):
+        """Records a request which got a response, closing the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """Records a request which failed transiently, opening the circuit once ``threshold`` is reached."""
+        with self._lock:
+            self.failures += 1
+            # While half-open, a single failure is enough to open the circuit again
+            if self.failures >= self.threshold or self._opened_at is not None:
+                self._opened_at = time.monotonic()
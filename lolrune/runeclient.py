@@ -1,13 +1,24 @@
-from typing import Tuple
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from . import utils
+from . import snapshot, utils
+from .cache import RuneCache
+from .core import RuneEngine
 from .errors import *
-from .runepage import Champion
+from .ratelimit import RateLimiter
+from .refresh import ChampDiff, next_delay
+from .retry import CircuitBreaker, RetryPolicy
+from .runepage import BulkResult, Champion
+from .stats import ClientStats
 
 
-class RuneClient:
+class RuneClient(RuneEngine):
     """A client which allows you get a champion's optimal runes.
     You can find a brief example :ref:`here <rune_client_ex>`.
 
@@ -15,7 +26,55 @@ class RuneClient:
     ----------
     session : :class:`requests.Session`, optional
         The main session which is used to make all requests.
-        If one is not passed, one will be created.
+        If one is not passed, one will be created with a connection pool sized by ``pool_size`` and ``pool_per_host``.
+
+    cache : :class:`RuneCache`, optional
+        A cache for parsed loadout pages, keyed by URL. Expired pages are revalidated with conditional requests.
+        If none is provided, every page is fetched and parsed on each call.
+
+    rune_links : dict, optional
+        A pre-loaded champion index, e.g. from a snapshot. If one is passed, the homepage is not fetched.
+
+    parser : str, optional
+        The html parser backend, either ``'bs4'`` or the faster ``'lxml'``. Both produce identical output.
+        Defaults to ``'bs4'``.
+
+    pool_size : int, optional
+        The total number of pooled connections kept by a session the client creates. Defaults to 32.
+
+    pool_per_host : int, optional
+        The number of pooled connections kept per host by a session the client creates.
+        Parallel fetches beyond this open throwaway connections. Defaults to 16.
+
+    timeout : Tuple[float, float], optional
+        The connect and read timeouts in seconds, applied to every request. Defaults to ``(5.0, 15.0)``.
+
+    keep_alive : bool, optional
+        Whether connections are kept open and reused between requests. Defaults to ``True``.
+
+    retry : :class:`RetryPolicy`, optional
+        How transient failures, such as timeouts and 5xx or 429 responses, are retried.
+        Defaults to ``RetryPolicy()``, pass ``RetryPolicy(retries=0)`` to disable retrying.
+
+    circuit_breaker : :class:`CircuitBreaker`, optional
+        Stops requests for a while after repeated failures. It can be shared between clients.
+        Defaults to ``CircuitBreaker()``.
+
+    serve_stale : bool, optional
+        Whether a loadout page which cannot be fetched is served from its last known version in ``cache``,
+        even if it expired. The error is raised if there is no such version. Defaults to ``False``.
+
+    stats : :class:`ClientStats`, optional
+        Collects request counts and per-stage timings. It can be shared between clients.
+        If none is provided, nothing is measured.
+
+    url : str, optional
+        The base URL to request instead of ``URL``, e.g. that of a :class:`~lolrune.server.FixtureServer`.
+        Loadout URLs are taken from the homepage, so they follow it.
+
+    rate_limiter : :class:`RateLimiter`, optional
+        Limits how fast requests are made, retries included. It can be shared between clients,
+        sync and async alike, to keep them all under one budget. If none is provided, requests are not limited.
 
     Attributes
     ----------
@@ -28,6 +87,9 @@ class RuneClient:
     rune_links : dict
         A dict containing all champ's individual rune pages.
 
+    refresh_stats : :class:`RefreshStats`
+        Timing metrics for background refreshes of ``rune_links``, see :meth:`start_auto_refresh`.
+
     Note
     ----
     The rune_links data is structured like so::
@@ -42,47 +104,340 @@ class RuneClient:
           ], ...
         }
     """
-    HEADERS = {'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:57.0) Gecko/20100101 Firefox/57.0'}
-    URL = 'http://runeforge.gg/'
 
-    def __init__(self, session: requests.Session = None):
-        self.session = session or requests.Session()
-        self.rune_links = utils.parse_rune_links(self._get(self.URL))
+    def __init__(self, session: requests.Session = None, cache: RuneCache = None, rune_links: dict = None,
+                 parser: str = 'bs4', pool_size: int = 32, pool_per_host: int = 16,
+                 timeout: Tuple[float, float] = (5.0, 15.0), keep_alive: bool = True, retry: RetryPolicy = None,
+                 circuit_breaker: CircuitBreaker = None, serve_stale: bool = False,
+                 stats: ClientStats = None, url: str = None,
+                 rate_limiter: RateLimiter = None):
+        super().__init__(cache=cache, parser=parser, retry=retry, circuit_breaker=circuit_breaker,
+                         serve_stale=serve_stale, stats=stats, url=url, rate_limiter=rate_limiter)
+        if session is None:
+            session = requests.Session()
+            # requests keeps one pool per host, each holding up to pool_maxsize connections
+            adapter = HTTPAdapter(pool_connections=max(pool_size // pool_per_host, 1), pool_maxsize=pool_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.timeout = timeout
+        if not keep_alive:
+            self._headers = {**self.HEADERS, 'Connection': 'close'}
+        self._inflight_lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_stop = None
+        self._snapshot_refresh = None
+        if rune_links is None:
+            rune_links = self._get_parsed(self.URL, self._parser.links)
+        self.rune_links = rune_links
+
+    @classmethod
+    def from_snapshot(cls, path: str, max_age: float = None, **kwargs) -> 'RuneClient':
+        """Creates a client from a snapshot file without any network I/O.
+        The snapshot's pages are loaded into the client's cache, creating a :class:`RuneCache` if none is passed.
+
+        Parameters
+        ----------
+        path : str
+            The snapshot file written by :meth:`save_snapshot`.
+
+        max_age : float, optional
+            The age in seconds after which the snapshot is considered stale.
+            A stale snapshot is still used, but its pages are fetched again before they are served,
+            and ``rune_links`` is refreshed in a background thread.
+            If none is passed, the snapshot is never refreshed.
 
-    def _get(self, url: str) -> str:
-        """A small wrapper method which makes a quick GET request.
+        \\*\\*kwargs
+            Passed on to :class:`RuneClient`.
+
+        Returns
+        -------
+        :class:`RuneClient`
+            A client serving the snapshot's data.
+
+        Raises
+        ------
+        SnapshotError
+            If the snapshot cannot be loaded.
+        """
+        snap = snapshot.load_snapshot(path)
+        stale = cls._snapshot_is_stale(snap, max_age)
+        cache = cls._load_snapshot_cache(snap, kwargs.pop('cache', None), stale)
+
+        client = cls(cache=cache, rune_links=snap.rune_links, **kwargs)
+        if stale:
+            client._snapshot_refresh = threading.Thread(target=client._refresh_in_background,
+                                                        name='lolrune-snapshot-refresh', daemon=True)
+            client._snapshot_refresh.start()
+
+        return client
+
+    def _refresh_in_background(self):
+        """Runs :meth:`update_champs`, recording it in ``refresh_stats`` and logging failures.
+        Any error is caught, so a homepage the parser chokes on does not end the refresher.
+        """
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            self.update_champs()
+        except Exception as e:
+            self._record_refresh(started, start, e)
+        else:
+            self._record_refresh(started, start)
+
+    def _auto_refresh(self, interval: float, jitter: float, stop: threading.Event):
+        while not stop.wait(next_delay(interval, jitter)):
+            self._refresh_in_background()
+
+    def start_auto_refresh(self, interval: float = 3600.0, jitter: float = 0.1):
+        """Starts refreshing ``rune_links`` periodically in a daemon thread.
+
+        The homepage is fetched and parsed in the background thread, and the new index is only
+        swapped in once it has been fully built, so lookups never block or see a partial index.
+        A failed refresh leaves the current index in place. See ``self.refresh_stats`` for timings.
+        Calling this while a refresher is running has no effect.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The average number of seconds between refreshes. Defaults to one hour.
+
+        jitter : float, optional
+            The largest fraction of ``interval`` added or removed at random for each wait. Defaults to ``0.1``.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        self._refresh_stop = threading.Event()
+        self._refresh_thread = threading.Thread(target=self._auto_refresh, args=(interval, jitter, self._refresh_stop),
+                                                name='lolrune-refresh', daemon=True)
+        self._refresh_thread.start()
+
+    def stop_auto_refresh(self, timeout: float = None):
+        """Stops the refresher started by :meth:`start_auto_refresh`, waiting for a running refresh to finish.
+        A refresh of a stale snapshot started by :meth:`from_snapshot` is waited for too.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait for. Waits indefinitely by default.
+        """
+        if self._snapshot_refresh is not None:
+            self._snapshot_refresh.join(timeout)
+            self._snapshot_refresh = None
+
+        if self._refresh_thread is None:
+            return
+
+        self._refresh_stop.set()
+        self._refresh_thread.join(timeout)
+        self._refresh_thread = None
+
+    def _get_once(self, url: str, headers: dict = None) -> utils.Response:
+        """Makes a single GET request, see :meth:`_get`."""
+        resp = self.session.get(url, headers=self._request_headers(headers), timeout=self.timeout)
+        return self._response(resp.status_code, resp.headers, resp.text, len(resp.content), bool(headers))
+
+    def _get(self, url: str, headers: dict = None) -> utils.Response:
+        """A small wrapper method which makes a quick GET request, no faster than ``self.rate_limiter`` allows.
+        Transient failures are retried according to ``self.retry``.
 
         Parameters
         ----------
         url : str
             The URL to get.
 
+        headers : dict, optional
+            Extra headers sent along with ``HEADERS``.
+
         Returns
         -------
-        str
-            The raw html of the requested page.
+        :obj:`utils.Response`
+            The status, headers and raw html of the requested page.
 
         Raises
         ------
         RuneConnectionError
-            If the GET response status is not 200.
+            If the GET response status is not 200, or 304 for a conditional request,
+            or if no response was received, e.g. because of a timeout, once retries ran out.
+
+        CircuitOpenError
+            If ``self.circuit_breaker`` is open.
         """
-        resp = self.session.get(url, headers=self.HEADERS)
-        if resp.status_code is 200:
-            return resp.text
-        else:
-            raise RuneConnectionError(resp.status_code)
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            start = time.perf_counter() if self.stats is not None else None
+            try:
+                resp = self._get_once(url, headers)
+            except (RuneConnectionError, requests.RequestException) as e:
+                delay = self._attempt_failed(url, attempt, e, start)
+                if delay is None:
+                    if isinstance(e, RuneConnectionError):
+                        raise
+                    raise RuneConnectionError(None, reason=repr(e)) from e
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self._attempt_succeeded(resp, start)
+                return resp
+
+    def _get_parsed(self, url: str, parser: Callable[[str], Any], previous: Any = None) -> Any:
+        """Makes a GET request and parses the response.
+        If ``previous`` is passed, the request is conditional, and ``previous`` is returned
+        without parsing if the page has not changed since it was last parsed.
+
+        Parameters
+        ----------
+        url : str
+            The URL to get.
+
+        parser : Callable[[str], Any]
+            Parses the raw html of the page.
+
+        previous : Any, optional
+            The result of parsing the page last time, if it is still at hand.
+
+        Returns
+        -------
+        Any
+            The parsed page.
+
+        Raises
+        ------
+        RuneConnectionError
+            If the GET response status is not 200 or 304.
+
+        RuneParseError
+            If the parser fails on the page.
+        """
+        resp = self._get(url, self._conditional_headers(url, previous))
+        return self._parse_response(url, resp, parser, previous)
+
+    def resolve_champion(self, champion_name: str) -> str:
+        """A method which resolves a loosely typed champion name to its key in ``self.rune_links``.
+        Case, spaces and punctuation are ignored, and common nicknames, unique prefixes and
+        small typos are accepted, e.g. ``"Kai'Sa"``, ``'wukong'`` and ``'velkz'``.
+
+        Parameters
+        ----------
+        champion_name : str
+            The champion name to resolve.
 
-    def update_champs(self):
+        Returns
+        -------
+        str
+            The champion's key in ``self.rune_links``.
+
+        Raises
+        ------
+        ChampNotFoundError
+            If the name matches no champion, or more than one.
+        """
+        return self._resolve(champion_name)
+
+    def update_champs(self, prefetch: bool = False, max_workers: int = 8) -> ChampDiff:
         """A method which updates ``self.rune_links``.
         This is useful because runeforge.gg is frequently updating.
+        The homepage is only parsed again if it has changed since the last update.
+
+        Cached pages of loadouts which are still listed are kept, and those of loadouts which are gone are dropped,
+        so only new loadouts need fetching afterwards.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            Whether to fetch and cache the new loadouts straight away. Failures are logged, not raised.
+            Defaults to ``False``.
+
+        max_workers : int, optional
+            The maximum number of loadouts prefetched at once. Defaults to 8.
+
+        Returns
+        -------
+        :obj:`ChampDiff`
+            The champions and loadout URLs which were added, removed or changed.
 
         Raises
         ------
         RuneConnectionError
-            If the GET response status is not 200.
+            If the GET response status is not 200 or 304.
+
+        RuneParseError
+            If the homepage cannot be parsed.
+
+        LoLRuneException
+            If no champions could be parsed from the homepage. ``self.rune_links`` is left untouched.
         """
-        self.rune_links = utils.parse_rune_links(self._get(self.URL))
+        diff = self._apply_links(self._get_parsed(self.URL, self._parser.links, self.rune_links or None))
+
+        if prefetch and diff.new_urls:
+            urls = list(diff.new_urls)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._fetch_rune_page, url) for url in urls]
+                self._log_prefetch(urls, [future.exception() or future.result() for future in futures])
+
+        return diff
+
+    def _load_rune_page(self, url: str) -> dict:
+        """Fetches, parses and caches a single loadout page, falling back to a stale copy if allowed."""
+        try:
+            rune_page = self._get_parsed(url, self._page_parser(url), self._previous_page(url))
+        except RuneConnectionError as e:
+            return self._stale_page(url, e)
+
+        return self._store_page(url, rune_page)
+
+    def _fetch_rune_page(self, url: str) -> dict:
+        """Fetches and parses a single loadout page.
+        Pages found in ``self.cache`` are returned without a request.
+        If the request fails and ``self.serve_stale`` is set, the last known version of the page is returned.
+
+        Threads asking for a page which is already being fetched wait for that fetch and share its result,
+        so a burst of lookups for one champion makes a single request per loadout.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the loadout page.
+
+        Returns
+        -------
+        dict
+            The parsed rune information for the loadout.
+        """
+        rune_page = self._cached_page(url)
+        if rune_page is not None:
+            return rune_page
+
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                # A previous leader may have stored the page and left since the cache was checked
+                rune_page = self._recheck_cache(url)
+                if rune_page is not None:
+                    return rune_page
+                future = self._inflight[url] = Future()
+
+        if self.stats is not None:
+            self.stats.record_lookup(coalesced=not leader)
+        if not leader:
+            return future.result()
+
+        try:
+            rune_page = self._load_rune_page(url)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(rune_page)
+            return rune_page
+        finally:
+            with self._inflight_lock:
+                del self._inflight[url]
 
     def get_raw(self, champion_name: str) -> Tuple[dict]:
         """The main method to retrieve **raw** optimal runes for a given champion.
@@ -90,7 +445,7 @@ class RuneClient:
         Parameters
         ----------
         champion_name : str
-            Case insensitive name of the champion to get runes for.
+            Name of the champion to get runes for, resolved with :meth:`resolve_champion`.
 
         Returns
         -------
@@ -101,22 +456,17 @@ class RuneClient:
         ----
         Please see :ref:`raw_return_formatting` for more information on the return type.
 
+        Warning
+        -------
+        The dicts are shared with ``self.cache`` and with the :class:`Champion`\\s built from them, whose
+        equality and hash are read from the dicts. Copy them, e.g. with :func:`copy.deepcopy`, before mutating them.
+
         Raises
         ------
         ChampNotFoundError
-            If the champion is not found in ``self.rune_links``.
+            If the champion cannot be resolved to one in ``self.rune_links``.
         """
-        # Check whether input is valid
-        champion_lower = champion_name.lower()
-        if champion_lower not in self.rune_links:
-            raise ChampNotFoundError(champion_name)
-
-        rune_list = []
-        for x in self.rune_links[champion_lower]:
-            html = self._get(x)
-            rune_list.append(utils.parse_rune_html(html, x))
-
-        return tuple(rune_list)
+        return tuple(self._fetch_rune_page(x) for x in self._champion_urls(champion_name))
 
     def get_runes(self, champion_name: str) -> Tuple[Champion]:
         """A method to retrieve a champion's runepage objects.
@@ -124,7 +474,7 @@ class RuneClient:
         Parameters
         ----------
         champion_name : str
-            Case insensitive name of the champion to get runes for.
+            Name of the champion to get runes for, resolved with :meth:`resolve_champion`.
         
         Returns
         -------
@@ -138,10 +488,100 @@ class RuneClient:
         Raises
         ------
         ChampNotFoundError
-            If the champion is not found in ``self.rune_links``.
+            If the champion cannot be resolved to one in ``self.rune_links``.
         """
-        champion_lower = champion_name.lower()
-        if champion_lower not in self.rune_links:
-            raise ChampNotFoundError(champion_name)
+        return self._build_all(self.get_raw(champion_name))
+
+    def iter_runes(self, *champion_names: str, max_workers: int = 8) -> Iterator[Champion]:
+        """A generator which yields the runepage objects of one or more champions as soon as each is parsed,
+        rather than once all of them are.
+
+        At most ``max_workers`` loadout pages are fetched at once, and the next is only requested
+        when one finishes, so memory stays bounded however many champions are requested.
+        Closing the generator early stops requesting pages, without waiting for those in flight.
+
+        Parameters
+        ----------
+        \\*champion_names : str
+            Names of the champions to get runes for, resolved with :meth:`resolve_champion`.
+
+        max_workers : int, optional
+            The maximum number of loadout pages fetched at once. Defaults to 8.
+
+        Yields
+        ------
+        :class:`Champion`
+            Each loadout, in the order the pages finish. Use :attr:`Champion.name` to tell champions apart.
+
+        Raises
+        ------
+        ChampNotFoundError
+            If a champion cannot be resolved, before any page is fetched.
+
+        RuneConnectionError
+            If a page cannot be fetched. Pages still in flight are abandoned without waiting for them.
+        """
+        urls = iter(self._resolve_urls(champion_names))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {executor.submit(self._fetch_rune_page, url) for url in islice(urls, max_workers)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rune_page = future.result()
+                    # Keep the pool busy while the caller handles this page
+                    for url in islice(urls, 1):
+                        pending.add(executor.submit(self._fetch_rune_page, url))
+                    yield self._build(rune_page)
+        finally:
+            for future in pending:
+                future.cancel()
+            # Not waiting lets an early close or an error return straight away,
+            # while fetches already running finish in the background
+            executor.shutdown(wait=False)
 
-        return tuple(Champion(x) for x in self.get_raw(champion_lower))
+    def get_runes_many(self, champion_names: Iterable[str], max_workers: int = 8) -> BulkResult:
+        """A method to retrieve the runepage objects of many champions at once.
+        The champions are fetched in parallel using a thread pool.
+
+        Parameters
+        ----------
+        champion_names : Iterable[str]
+            Case insensitive names of the champions to get runes for.
+
+        max_workers : int, optional
+            The maximum number of champions fetched at once. Defaults to 8.
+
+        Returns
+        -------
+        :obj:`BulkResult`
+            The fetched :class:`Champion`\\s, along with any errors raised for individual champions.
+            A failing champion does not abort the rest of the batch.
+        """
+        names = self._distinct(champion_names)
+        results = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(self.get_runes, name) for name in names]:
+                try:
+                    results.append(future.result())
+                except LoLRuneException as e:
+                    results.append(e)
+
+        return self._bulk_result(names, results)
+
+    def get_all_runes(self, max_workers: int = 8) -> BulkResult:
+        """A method to retrieve the runepage objects of every champion in ``self.rune_links``.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of champions fetched at once. Defaults to 8.
+
+        Returns
+        -------
+        :obj:`BulkResult`
+            See :meth:`get_runes_many`.
+        """
+        return self.get_runes_many(self.rune_links, max_workers=max_workers)
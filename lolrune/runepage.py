@@ -1,6 +1,9 @@
-from typing import NamedTuple, List
+from sys import intern
+from typing import NamedTuple, Dict, Tuple
 
-Tree = NamedTuple('Tree', [('name', str), ('runes', List[str])])
+from .errors import LoLRuneException
+
+Tree = NamedTuple('Tree', [('name', str), ('runes', Tuple[str, ...])])
 """A :func:`namedtuple <collections.namedtuple>` which represents a specific tree in a :class:`RunePage`.
 
 Attributes
@@ -8,22 +11,46 @@ Attributes
 name : str
     The name of the rune tree, e.g. ``'Precision'``.
 
-runes : List[str]
-    A list of runes in a page, e.g.:
+runes : Tuple[str, ...]
+    A tuple of runes in a page, e.g.:
     
     .. code:: python3
 
-        ['Cheap Shot', 'Ghost Poro', 'Relentless Hunter']
+        ('Cheap Shot', 'Ghost Poro', 'Relentless Hunter')
 """
 
 
-class Champion:
+def _make_tree(tree: dict) -> Tree:
+    # Tree and rune names come from a small vocabulary, so interning them
+    # lets every cached page share the same string objects
+    return Tree(name=intern(tree['name']), runes=tuple(intern(x) for x in tree['rest']))
+
+
+class _Frozen:
+    """A mixin which makes slotted objects immutable once ``__init__`` has run."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} objects are immutable'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} objects are immutable'.format(type(self).__name__))
+
+
+class Champion(_Frozen):
     """Represents a champion and contains that champ's rune page.
+    Champions are immutable and hashable, so they can be used as dict keys and in sets.
+
+    A champion is a lazy view over the raw rune data: attributes are read from the dict on access,
+    and the :class:`RunePage` is only built the first time :attr:`runes` is accessed,
+    so building many champions costs little more than fetching the raw data.
+    The champion's name is interned the first time it is read.
 
     Parameters
     ----------
     rune_data : dict
         The entirety of the rune page data returned by :meth:`RuneClient.get_raw` and :meth:`AioRuneClient.get_raw`.
+        It is shared, not copied, so it should not be mutated afterwards.
 
     Attributes
     ----------
@@ -49,24 +76,83 @@ class Champion:
     For more information on this object and other data objects, please see :ref:`abs_return_formatting`
     """
 
+    __slots__ = ('_data', '_name', '_runes')
+
     def __init__(self, rune_data: dict):
-        self.name = rune_data['name']
-        self.title = rune_data['title']
-        self.description = rune_data['description']
-        self.runes = RunePage(rune_data['runes'])
-        self.url = rune_data['url']
+        init = object.__setattr__
+        init(self, '_data', rune_data)
+        init(self, '_name', None)
+        init(self, '_runes', None)
+
+    @property
+    def name(self) -> str:
+        name = self._name
+        if name is None:
+            name = intern(self._data['name'])
+            object.__setattr__(self, '_name', name)
+        return name
+
+    @property
+    def title(self) -> str:
+        return self._data['title']
+
+    @property
+    def description(self) -> str:
+        return self._data['description']
+
+    @property
+    def url(self) -> str:
+        return self._data['url']
+
+    @property
+    def runes(self) -> 'RunePage':
+        runes = self._runes
+        if runes is None:
+            runes = RunePage(self._data['runes'])
+            object.__setattr__(self, '_runes', runes)
+        return runes
 
     def __repr__(self) -> str:
         return '<Champion name={0.name!r} description={0.description!r}>'.format(self)
 
     def __eq__(self, other) -> bool:
-        return (isinstance(other, Champion)
-                and self.name == other.name
-                and self.description == other.description)
+        return self is other or (isinstance(other, Champion)
+                                 and self.name == other.name
+                                 and self.description == other.description)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.description))
+
+    def __reduce__(self):
+        return Champion, (self.to_dict(),)
+
+    def to_dict(self) -> dict:
+        """Converts the champion back into the raw format it was created from.
+
+        Returns
+        -------
+        dict
+            The rune data, structured like the dicts returned by :meth:`RuneClient.get_raw`.
+        """
+        data = self._data
+        return {'name': data['name'], 'title': data['title'], 'description': data['description'],
+                'url': data['url'], 'runes': _copy_page(data['runes'])}
 
 
-class RunePage:
+def _copy_page(rune_page: dict) -> dict:
+    """Returns a copy of ``rune_data['runes']`` which shares nothing mutable with it."""
+    primary = rune_page['primary']
+    secondary = rune_page['secondary']
+    return {'primary': {'name': primary['name'], 'keystone': primary['keystone'], 'rest': list(primary['rest'])},
+            'secondary': {'name': secondary['name'], 'rest': list(secondary['rest'])}}
+
+
+class RunePage(_Frozen):
     """An object representing a specific rune page for a :class:`Champion`.
+    Rune pages are immutable and hashable, so they can be used as dict keys and in sets.
+
+    Like :class:`Champion`, a rune page is a lazy view: the keystone is interned and each :obj:`Tree`
+    is built on first access.
 
     Parameters
     ----------
@@ -89,17 +175,82 @@ class RunePage:
     For more information on this object and other data objects, please see :ref:`abs_return_formatting`
     """
 
+    __slots__ = ('_data', '_keystone', '_primary', '_secondary', '_hash')
+
     def __init__(self, rune_page: dict):
-        self.__dict__.update(rune_page)
-        self.keystone = rune_page['primary']['keystone']
-        self.primary = Tree(name=rune_page['primary']['name'], runes=rune_page['primary']['rest'])
-        self.secondary = Tree(name=rune_page['secondary']['name'], runes=rune_page['secondary']['rest'])
+        init = object.__setattr__
+        init(self, '_data', rune_page)
+        init(self, '_keystone', None)
+        init(self, '_primary', None)
+        init(self, '_secondary', None)
+        init(self, '_hash', None)
+
+    @property
+    def keystone(self) -> str:
+        keystone = self._keystone
+        if keystone is None:
+            keystone = intern(self._data['primary']['keystone'])
+            object.__setattr__(self, '_keystone', keystone)
+        return keystone
+
+    @property
+    def primary(self) -> Tree:
+        tree = self._primary
+        if tree is None:
+            tree = _make_tree(self._data['primary'])
+            object.__setattr__(self, '_primary', tree)
+        return tree
+
+    @property
+    def secondary(self) -> Tree:
+        tree = self._secondary
+        if tree is None:
+            tree = _make_tree(self._data['secondary'])
+            object.__setattr__(self, '_secondary', tree)
+        return tree
 
     def __repr__(self) -> str:
         return '<RunePage keystone={0.keystone!r} secondary={0.secondary.name!r}>'.format(self)
 
     def __eq__(self, other) -> bool:
-        return (isinstance(other, RunePage)
-                and self.keystone == other.keystone
-                and self.primary == other.primary
-                and self.secondary == self.secondary)
+        # Comparing the cached hashes first rejects almost every unequal page cheaply
+        return self is other or (isinstance(other, RunePage)
+                                 and hash(self) == hash(other)
+                                 and self.keystone == other.keystone
+                                 and self.primary == other.primary
+                                 and self.secondary == other.secondary)
+
+    def __hash__(self) -> int:
+        page_hash = self._hash
+        if page_hash is None:
+            page_hash = hash((self.keystone, self.primary, self.secondary))
+            object.__setattr__(self, '_hash', page_hash)
+        return page_hash
+
+    def __reduce__(self):
+        return RunePage, (self.to_dict(),)
+
+    def to_dict(self) -> dict:
+        """Converts the rune page back into the raw format it was created from.
+
+        Returns
+        -------
+        dict
+            The rune page, structured like ``rune_data['runes']``.
+        """
+        return _copy_page(self._data)
+
+
+BulkResult = NamedTuple('BulkResult', [('runes', Dict[str, Tuple[Champion]]), ('errors', Dict[str, LoLRuneException])])
+"""A :func:`namedtuple <collections.namedtuple>` returned by the bulk methods,
+e.g. :meth:`RuneClient.get_runes_many` and :meth:`AioRuneClient.get_runes_many`.
+
+Attributes
+----------
+runes : Dict[str, Tuple[:class:`Champion`]]
+    The champions which were fetched successfully, keyed by the name they were requested with.
+
+errors : Dict[str, :class:`LoLRuneException`]
+    The champions which could not be fetched, keyed by the name they were requested with,
+    along with the exception which was raised for them.
+"""
@@ -0,0 +1,146 @@
+"""A local stand-in for runeforge.gg which serves saved pages over HTTP.
+
+Run ``python -m lolrune.server`` to serve the bundled fixtures, then point a client at it with its ``url`` argument.
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Mapping, Sequence
+
+from .replay import FIXTURES_DIR, ReplaySession, load_fixtures
+
+UPSTREAM = 'http://runeforge.gg'
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    server_version = 'lolrune-fixtures'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        fixtures = self.server.fixtures
+        with fixtures._lock:
+            resp = fixtures.session._lookup(fixtures.upstream + self.path)
+        if resp._delay:
+            # Each request has its own thread, so this only delays this response
+            time.sleep(resp._delay)
+
+        # Links on the pages point at runeforge.gg, so they are rewritten to keep the client on this server
+        body = resp.text.replace(fixtures.upstream, fixtures.url).encode('utf-8')
+        self.send_response(resp.status_code)
+        for name, value in resp.headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureServer:
+    """A local HTTP server which serves saved runeforge.gg pages, for load testing and benchmarking offline.
+
+    It is the over-the-wire counterpart of :class:`ReplaySession`: requests go through the clients' real
+    sessions, so connection pooling, timeouts and retries are exercised too.
+    Point either client at it with ``url=server.url``.
+
+    The server can be used as a context manager, which starts it in a background thread and stops it on exit.
+
+    Parameters
+    ----------
+    pages : Mapping[str, str], optional
+        The raw html of each page, keyed by its runeforge.gg URL. Defaults to the bundled fixtures.
+
+    host : str, optional
+        The address to listen on. Defaults to ``'127.0.0.1'``.
+
+    port : int, optional
+        The port to listen on. Defaults to 0, which picks a free port.
+
+    \\*\\*faults
+        Latency and error injection, passed on to :class:`ReplaySession`, e.g. ``latency=0.05, error_rate=0.1``.
+
+    Attributes
+    ----------
+    session : :class:`ReplaySession`
+        The session pages are looked up in. Its ``requests`` and ``errors`` count what the server served.
+    """
+
+    def __init__(self, pages: Mapping[str, str] = None, host: str = '127.0.0.1', port: int = 0, **faults):
+        self.session = ReplaySession(pages, **faults)
+        self.upstream = UPSTREAM
+        self._lock = threading.Lock()
+        self._httpd = _ThreadingHTTPServer((host, port), _FixtureHandler)
+        self._httpd.fixtures = self
+        self._thread = None
+
+    def __repr__(self) -> str:
+        return '<FixtureServer url={0.url!r} requests={0.session.requests}>'.format(self)
+
+    def __enter__(self) -> 'FixtureServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """str: The base URL of the server, without a trailing slash."""
+        host, port = self._httpd.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        """Starts serving in a daemon thread. Calling this while the server is running has no effect."""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='lolrune-fixtures', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the server and closes its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self):
+        """Serves in the current thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m lolrune.server', description=__doc__.splitlines()[0])
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='fixture directory containing an index.json')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds each response takes')
+    parser.add_argument('--jitter', type=float, default=0.0, help='seconds added to or removed from the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with an error')
+    parser.add_argument('--error-status', type=int, default=503, help='status of injected errors')
+    parser.add_argument('--seed', type=int, help='seed for the random latency and errors')
+    args = parser.parse_args(argv)
+
+    server = FixtureServer(load_fixtures(args.fixtures), args.host, args.port, latency=args.latency,
+                           jitter=args.jitter, error_rate=args.error_rate, error_status=args.error_status,
+                           seed=args.seed)
+    print('Serving {} on {}'.format(args.fixtures, server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import json
+import os
+import time
+from typing import Dict, Iterable, NamedTuple
+
+from .errors import SnapshotError
+
+SNAPSHOT_VERSION = 1
+
+Snapshot = NamedTuple('Snapshot', [('rune_links', dict), ('pages', Dict[str, dict]), ('created', float)])
+"""A :func:`namedtuple <collections.namedtuple>` holding the contents of a snapshot file.
+
+Attributes
+----------
+rune_links : dict
+    The champion index, structured like ``RuneClient.rune_links``.
+
+pages : Dict[str, dict]
+    Parsed loadout pages keyed by their URL, structured like the dicts returned by ``get_raw``.
+
+created : float
+    The unix timestamp the snapshot was written at.
+"""
+
+
+def save_snapshot(path: str, rune_links: dict, pages: Iterable[dict], created: float = None):
+    """Writes ``rune_links`` and parsed loadout pages to a snapshot file.
+
+    The file is in JSON lines format: a header line holding the format version,
+    the creation time and ``rune_links``, followed by one parsed page per line.
+    It is written to a temporary file first and then moved into place,
+    so readers never see a partially written snapshot.
+
+    Parameters
+    ----------
+    path : str
+        Where to write the snapshot.
+
+    rune_links : dict
+        The champion index to store.
+
+    pages : Iterable[dict]
+        The parsed loadout pages to store, as returned by ``get_raw``.
+
+    created : float, optional
+        The creation timestamp to record. Defaults to the current time.
+    """
+    header = {'version': SNAPSHOT_VERSION,
+              'created': time.time() if created is None else created,
+              'rune_links': rune_links}
+
+    tmp_path = '{}.tmp'.format(path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header, separators=(',', ':')))
+        f.write('\n')
+        for page in pages:
+            f.write(json.dumps(page, separators=(',', ':')))
+            f.write('\n')
+
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """Reads a snapshot file written by :func:`save_snapshot`.
+
+    Parameters
+    ----------
+    path : str
+        The snapshot file to read.
+
+    Returns
+    -------
+    :obj:`Snapshot`
+        The champion index and parsed pages stored in the file.
+
+    Raises
+    ------
+    SnapshotError
+        If the file cannot be read, or is empty, malformed or written in an unsupported format version.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            header = json.loads(f.readline() or 'null')
+            if not isinstance(header, dict):
+                raise SnapshotError(path, 'missing header')
+            if header.get('version') != SNAPSHOT_VERSION:
+                raise SnapshotError(path, 'unsupported version {!r}'.format(header.get('version')))
+            rune_links = header['rune_links']
+            created = header['created']
+
+            pages = {}
+            for line in f:
+                if line.strip():
+                    page = json.loads(line)
+                    pages[page['url']] = page
+    except OSError as e:
+        raise SnapshotError(path, e.strerror or str(e)) from e
+    except (ValueError, KeyError, TypeError) as e:
+        raise SnapshotError(path, 'malformed data ({!r})'.format(e)) from e
+
+    return Snapshot(rune_links=rune_links, pages=pages, created=created)
@@ -0,0 +1,207 @@
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Optional, Sequence
+
+# Upper bounds in seconds, from a cached lookup up to a request close to the read timeout
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+STAGES = ('fetch', 'parse', 'build')
+
+
+class Histogram:
+    """A fixed-bucket latency histogram.
+
+    Parameters
+    ----------
+    buckets : Sequence[float], optional
+        The sorted upper bounds of the buckets in seconds. The last one should be ``float('inf')``.
+        Defaults to ``LATENCY_BUCKETS``.
+
+    Attributes
+    ----------
+    count : int
+        The number of observations.
+
+    total : float
+        The sum of every observation.
+
+    max : float
+        The largest observation, or ``0.0`` if there were none.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return '<Histogram count={0.count} mean={0.mean:.6f} max={0.max:.6f}>'.format(self)
+
+    @property
+    def mean(self) -> float:
+        """float: The mean observation, or ``0.0`` if there were none."""
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float):
+        """Records one observation. Values above the last bound are counted in the last bucket."""
+        self.counts[min(bisect_left(self.buckets, value), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Returns an upper bound of the ``q`` percentile, i.e. the bound of the bucket it falls in.
+        Returns ``0.0`` if there were no observations.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Returns the histogram as a plain dict, with non-cumulative ``[upper bound, count]`` buckets.
+        An infinite bound is given as ``None``, which JSON can represent.
+        """
+        return {'count': self.count, 'sum': self.total, 'max': self.max,
+                'buckets': [[None if bound == float('inf') else bound, count]
+                            for bound, count in zip(self.buckets, self.counts)]}
+
+
+class ClientStats:
+    """Counters and per-stage latency histograms for a client's requests.
+    Pass one as the ``stats`` of a :class:`RuneClient` or :class:`AioRuneClient` to enable them.
+    Clients without one skip every measurement.
+
+    The stages are ``'fetch'``, a single GET attempt including reading the body,
+    ``'parse'``, turning the html into a dict, and ``'build'``, turning dicts into :class:`Champion`\\s.
+
+    A stats object is thread-safe and can be shared between several clients.
+
+    Parameters
+    ----------
+    callback : Callable[[str, float], None], optional
+        Called with the stage and the duration in seconds of every measurement, e.g. to forward it
+        to a metrics system. It runs on the request path, so it should be quick.
+
+    buckets : Sequence[float], optional
+        The histogram bucket bounds in seconds. Defaults to ``LATENCY_BUCKETS``.
+
+    Attributes
+    ----------
+    stages : Dict[str, :class:`Histogram`]
+        The latency histogram of each stage.
+
+    requests : int
+        The number of GET attempts made, retries included.
+
+    not_modified : int
+        The number of conditional requests answered with 304, which skip parsing.
+
+    bytes_downloaded : int
+        The size of every response body received, in bytes after any content encoding such as gzip is decoded.
+
+    cache_hits : int
+        The number of loadout pages served from the client's cache.
+
+    cache_misses : int
+        The number of loadout pages which were not in the client's cache, or which had no cache to look in.
+
+    coalesced : int
+        The number of loadout pages which were already being fetched, and shared that fetch.
+
+    errors : Counter
+        The number of failed GET attempts by response status, with ``None`` for those which got no response.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, float], None]] = None,
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.callback = callback
+        self.stages = {stage: Histogram(buckets) for stage in STAGES}
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_downloaded = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+        self.errors = Counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return ('<ClientStats requests={0.requests} errors={1} bytes_downloaded={0.bytes_downloaded} '
+                'cache_hits={0.cache_hits}>'.format(self, sum(self.errors.values())))
+
+    def observe(self, stage: str, seconds: float):
+        """Records how long a stage took.
+
+        Parameters
+        ----------
+        stage : str
+            ``'fetch'``, ``'parse'`` or ``'build'``.
+
+        seconds : float
+            The duration of the stage.
+        """
+        with self._lock:
+            self.stages[stage].observe(seconds)
+        if self.callback is not None:
+            self.callback(stage, seconds)
+
+    def record_response(self, status: int, size: int):
+        """Records a GET attempt which got a usable response of ``size`` bytes."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += size
+            if status == 304:
+                self.not_modified += 1
+
+    def record_error(self, status: Optional[int]):
+        """Records a failed GET attempt, with the status it failed with or ``None`` if there was no response."""
+        with self._lock:
+            self.requests += 1
+            self.errors[status] += 1
+
+    def record_lookup(self, hit: bool = False, coalesced: bool = False):
+        """Records a loadout page lookup, and whether the cache or an ongoing fetch served it."""
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                if coalesced:
+                    self.coalesced += 1
+
+    def reset(self):
+        """Resets every counter and histogram."""
+        with self._lock:
+            for histogram in self.stages.values():
+                histogram.__init__(histogram.buckets)
+            self.requests = 0
+            self.not_modified = 0
+            self.bytes_downloaded = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.coalesced = 0
+            self.errors.clear()
+
+    def to_dict(self) -> dict:
+        """Returns the metrics as a plain, JSON serializable dict, e.g. for exporting them."""
+        with self._lock:
+            return {'requests': self.requests,
+                    'not_modified': self.not_modified,
+                    'bytes_downloaded': self.bytes_downloaded,
+                    'cache_hits': self.cache_hits,
+                    'cache_misses': self.cache_misses,
+                    'coalesced': self.coalesced,
+                    'errors': {'none' if status is None else str(status): count
+                               for status, count in self.errors.items()},
+                    'stages': {stage: histogram.to_dict() for stage, histogram in self.stages.items()}}
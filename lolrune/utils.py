@@ -1,7 +1,58 @@
 import json
 import re
+from typing import Callable, Mapping, NamedTuple, Optional
 
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+Response = NamedTuple('Response', [('status', int), ('headers', Mapping[str, str]), ('text', str), ('size', int)])
+Response.__doc__ = """The parts of an HTTP response the clients use, independent of the HTTP library.
+``size`` is the length of the body in bytes, after any content encoding such as gzip is decoded."""
+
+Validator = NamedTuple('Validator', [('etag', Optional[str]), ('last_modified', Optional[str])])
+Validator.__doc__ = """The cache validators sent with a URL's last 200 response."""
+
+
+def conditional_headers(validator: Optional[Validator]) -> dict:
+    """A function which builds the headers for a conditional GET request.
+
+    Parameters
+    ----------
+    validator : Optional[Validator]
+        The validators stored for the URL, if any.
+
+    Returns
+    -------
+    dict
+        The ``If-None-Match`` and ``If-Modified-Since`` headers, or an empty dict if there is nothing to validate.
+    """
+    headers = {}
+    if validator is not None:
+        if validator.etag:
+            headers['If-None-Match'] = validator.etag
+        if validator.last_modified:
+            headers['If-Modified-Since'] = validator.last_modified
+    return headers
+
+
+def make_validator(headers: Mapping[str, str]) -> Optional[Validator]:
+    """A function which extracts the cache validators from response headers.
+
+    Parameters
+    ----------
+    headers : Mapping[str, str]
+        The case insensitive headers of a 200 response.
+
+    Returns
+    -------
+    Optional[Validator]
+        The validators, or ``None`` if the response had neither an ``ETag`` nor a ``Last-Modified`` header.
+    """
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if etag is None and last_modified is None:
+        return None
+    return Validator(etag=etag, last_modified=last_modified)
 
 
 def parse_rune_links(html: str) -> dict:
@@ -75,3 +126,128 @@ def parse_rune_html(html: str, url: str) -> dict:
     return {'name': champ, 'title': title, 'description': description, 'url': url,
             'runes': {'primary': {'name': p_tree, 'keystone': keystone, 'rest': p_rest},
                       'secondary': {'name': s_tree, 'rest': s_rest}}}
+
+
+def _has_class(tag: str, class_: str) -> str:
+    """Builds an XPath expression matching ``tag`` elements with ``class_`` among their classes,
+    the same way BeautifulSoup's ``class_`` argument matches."""
+    return "//{}[contains(concat(' ', normalize-space(@class), ' '), ' {} ')]".format(tag, class_)
+
+
+# Compiled once, so each parse is a single scan of the tree per expression
+_CHAMPION_NODES = etree.XPath('{} | {}'.format(_has_class('li', 'champion'), _has_class('div', 'champion-modal-open')))
+_LOADOUT_NODES = etree.XPath(' | '.join([_has_class('h1', 'champion-header--title'),
+                                         _has_class('h2', 'loadout-title'),
+                                         _has_class('h2', 'rune-path--name'),
+                                         _has_class('a', 'rune-name')]))
+
+
+def parse_rune_links_lxml(html: str) -> dict:
+    """A faster version of :func:`parse_rune_links` which uses lxml directly rather than BeautifulSoup.
+    Both champion lists are collected in a single XPath query, and the output is identical.
+
+    Parameters
+    ----------
+    html : str
+        The string representation of the html obtained via a GET request.
+
+    Returns
+    -------
+    dict
+        The nested rune_links champ rune pages from runeforge.
+    """
+    single_page = {}
+    double_page = {}
+
+    for node in _CHAMPION_NODES(lxml_html.document_fromstring(html)):
+        if node.tag == 'li':
+            # Champs with only a single runepage
+            link = node.find('.//a')
+            if link is not None:
+                style = link.find('.//div').find('.//div').get('style')
+                single_page[re.split(r'\W+', style)[-3].lower()] = [link.get('href')]
+        else:
+            # Champs with two (or more) runepages, stored as JSON
+            loadouts = json.loads(node.get('data-loadouts'))
+            double_page[re.sub('[^A-Za-z0-9]+', '', loadouts[0]['champion'].lower())] = [loadouts[0]['link'],
+                                                                                          loadouts[1]['link']]
+
+    return {**single_page, **double_page}
+
+
+def parse_rune_html_lxml(html: str, url: str) -> dict:
+    """A faster version of :func:`parse_rune_html` which uses lxml directly rather than BeautifulSoup.
+    Every classed element is collected in a single XPath query, and the output is identical.
+
+    Parameters
+    ----------
+    html : str
+        The string representation of the html obtained via a GET request
+
+    url : str
+        The URL for the runeforge page being parsed.
+
+    Returns
+    -------
+    dict
+        Contains champ rune info described in ``RuneClient`` and ``AioRuneClient``.
+    """
+    root = lxml_html.document_fromstring(html)
+
+    champ = title = None
+    trees = []
+    all_runes = []
+    for node in _LOADOUT_NODES(root):
+        if node.tag == 'a':
+            all_runes.append(node.text_content())
+        elif node.tag == 'h1':
+            if champ is None:
+                champ = node.text_content()
+        elif 'loadout-title' in node.get('class').split():
+            if title is None:
+                title = node.text_content()
+        else:
+            trees.append(node.text_content())
+
+    if champ is None or title is None:
+        raise ValueError('{} is missing its champion name or loadout title'.format(url))
+
+    description = root.find('.//p').text_content()
+    p_tree, s_tree = trees
+
+    return {'name': champ, 'title': title, 'description': description, 'url': url,
+            'runes': {'primary': {'name': p_tree, 'keystone': all_runes[0], 'rest': all_runes[1:4]},
+                      'secondary': {'name': s_tree, 'rest': all_runes[4:7]}}}
+
+
+Parser = NamedTuple('Parser', [('links', Callable[[str], dict]), ('page', Callable[[str, str], dict])])
+Parser.__doc__ = """A pair of functions parsing the homepage and a loadout page."""
+
+PARSERS = {
+    'bs4': Parser(links=parse_rune_links, page=parse_rune_html),
+    'lxml': Parser(links=parse_rune_links_lxml, page=parse_rune_html_lxml),
+}
+
+
+def get_parser(name: str) -> Parser:
+    """A function which looks up a parser backend by name.
+
+    Parameters
+    ----------
+    name : str
+        Either ``'bs4'`` or ``'lxml'``.
+
+    Returns
+    -------
+    Parser
+        The parsing functions of the backend.
+
+    Raises
+    ------
+    ValueError
+        If there is no backend called ``name``.
+    """
+    try:
+        return PARSERS[name]
+    except KeyError:
+        raise ValueError('Unknown parser {!r}, expected one of {}'.format(name, ', '.join(sorted(PARSERS)))) from None
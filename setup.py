@@ -15,6 +15,7 @@ except (FileNotFoundError, IOError):
 setup(
     name='lolrune',
     packages=['lolrune'],
+    package_data={'lolrune': ['fixtures/*.html', 'fixtures/*.json', 'fixtures/loadouts/*.html']},
     description='A set of clients which allows you to gather optimal runes for a given League of Legends champion.',
     long_description=long_description,
     use_scm_version={
@@ -24,7 +25,10 @@ setup(
     setup_requires=['setuptools_scm'],
     install_requires=['requests', 'bs4', 'lxml'],
     extras_require={
-        'async': ['aiohttp>=2.3.3']
+        'async': ['aiohttp>=3.3']
+    },
+    entry_points={
+        'console_scripts': ['lolrune=lolrune.cli:main']
     },
     author='James E',
     author_email='naught0@github.com',